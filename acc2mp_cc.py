@@ -0,0 +1,168 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# acc2mp-cc: compiler driver that translates the sources in memory and pipes
+# them to the compiler, as in 'python acc2mp_cc.py gcc -fopenmp -c a.c'
+# -----------------------------------------------------------------------------
+
+import os
+import subprocess
+import sys
+import threading
+
+import parser
+from diagnostics import Diagnostics
+
+# Language given to the compiler for each extension of the translated sources
+LANGUAGES = {'.c': 'c', '.cpp': 'c++'}
+
+# Options that stop the compiler before linking and the extension of the
+# file each one writes when no -o is given. -E writes to the standard output
+STAGES = {'-c': '.o', '-S': '.s', '-E': None}
+
+# Options of the compiler whose argument is the next one
+OPTIONS_WITH_ARGUMENT = {
+    '-o', '-x', '-I', '-D', '-U', '-L', '-l', '-include', '-imacros',
+    '-isystem', '-iquote', '-idirafter', '-iprefix', '-isysroot', '-MF',
+    '-MT', '-MQ', '-T', '-u', '-z', '-Xlinker', '-Xassembler',
+    '-Xpreprocessor', '-aux-info', '--param',
+}
+
+# Compiler used when the command line does not start with one
+DEFAULT_COMPILER = 'cc'
+
+# Return: Language of the file 'path' when it is a source to translate, None
+# otherwise
+def _language(path):
+    return LANGUAGES.get(os.path.splitext(path)[1])
+
+# Return: Tuple with the compiler, the list of its arguments and the list of
+# the positions of the sources to translate in the arguments. The compiler is
+# $CC when the command line starts with an option or a source. The files
+# following an explicit -x are given to the compiler as they are
+def split_command(argv):
+    if argv and not argv[0].startswith('-') and _language(argv[0]) is None:
+        compiler, args = argv[0], argv[1:]
+    else:
+        compiler, args = os.environ.get('CC', DEFAULT_COMPILER), argv
+    sources = []
+    forced = False
+    skip = False
+    for i, arg in enumerate(args):
+        if skip:
+            skip = False
+            if args[i - 1] == '-x':
+                forced = arg != 'none'
+        elif arg in OPTIONS_WITH_ARGUMENT:
+            skip = True
+        elif arg.startswith('-x') and len(arg) > 2:
+            forced = arg[2:] != 'none'
+        elif not arg.startswith('-') and not forced and _language(arg):
+            sources.append(i)
+    return compiler, args, sources
+
+# Return: Bytes of the translation of the file 'src', with linemarkers so the
+# compiler reports the lines and the name of 'src'. The pragmas that cannot
+# be translated are given to the compiler as they are, with a warning
+def translate_source(src):
+    with open(src, 'r', encoding=parser.MMAP_ENCODING,
+              errors='surrogateescape') as input_file:
+        text = input_file.read()
+    diagnostics = Diagnostics(src)
+    result = parser.translate(text, filename=src, diagnostics=diagnostics)
+    diagnostics.report(sys.stderr)
+    return result.encode(parser.MMAP_ENCODING, 'surrogateescape')
+
+# Return: List of arguments giving the translation of 'src', read from
+# 'path', to the compiler. The directory of 'src' is searched for the quoted
+# includes as the compiler would do for 'src' itself
+def _source_arguments(src, path):
+    return ['-iquote', os.path.dirname(src) or '.', '-x', _language(src),
+            path, '-x', 'none']
+
+# Write 'data' to the file descriptor 'fd' and close it
+def _feed(fd, data):
+    try:
+        with os.fdopen(fd, 'wb') as pipe:
+            pipe.write(data)
+    except BrokenPipeError:
+        # The compiler stopped reading, it reports the error itself
+        pass
+
+# Run 'compiler' with 'args' where the sources at the positions 'sources'
+# are replaced by their translations. When the compiler stops before
+# linking or there is a single source, the compiler is run once per source
+# and reads the translation from its standard input. Otherwise it is run once
+# and reads every translation from a pipe of its own.
+# Return: Exit status of the compiler, the first one that failed
+def compile_command(compiler, args, sources):
+    translations = [translate_source(args[i]) for i in sources]
+    stage = None
+    for arg in args:
+        if arg in STAGES:
+            stage = arg
+    has_output = '-o' in args
+    if not sources:
+        return subprocess.call([compiler] + args)
+
+    if stage is not None or len(sources) == 1:
+        if has_output and len(sources) > 1:
+            sys.stderr.write("acc2mp-cc: error: -o cannot be used with %s and "
+                             "several sources\n" % stage)
+            return 1
+        others = [arg for i, arg in enumerate(args) if i not in sources]
+        for i, data in zip(sources, translations):
+            src = args[i]
+            position = i - sum(1 for j in sources if j < i)
+            command = ([compiler] + others[:position] +
+                       _source_arguments(src, '-') + others[position:])
+            if STAGES.get(stage) and not has_output:
+                base = os.path.splitext(os.path.basename(src))[0]
+                command += ['-o', base + STAGES[stage]]
+            status = subprocess.run(command, input=data).returncode
+            if status != 0:
+                return status
+        return 0
+
+    command = [compiler]
+    reads = []
+    feeders = []
+    for i, arg in enumerate(args):
+        if i not in sources:
+            command.append(arg)
+            continue
+        read, write = os.pipe()
+        reads.append(read)
+        command += _source_arguments(arg, '/dev/fd/%d' % read)
+        data = translations[sources.index(i)]
+        feeders.append(threading.Thread(target=_feed, args=(write, data)))
+    try:
+        process = subprocess.Popen(command, pass_fds=reads)
+    finally:
+        for read in reads:
+            os.close(read)
+    for feeder in feeders:
+        feeder.start()
+    status = process.wait()
+    for feeder in feeders:
+        feeder.join()
+    return status
+
+if __name__ == '__main__':
+
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help'):
+        print("usage: acc2mp-cc [compiler] arguments...\n\n"
+              "Translate the OpenACC pragmas of the .c and .cpp sources of a "
+              "compiler command\nline to OpenMP and pipe the translations to "
+              "the compiler, without writing\nthem to disk. The compiler is "
+              "$CC or %s when the command line starts with\nan option or a "
+              "source." % DEFAULT_COMPILER)
+        sys.exit(0 if len(sys.argv) == 2 else 2)
+
+    compiler, args, sources = split_command(sys.argv[1:])
+    try:
+        status = compile_command(compiler, args, sources)
+    except OSError as e:
+        sys.stderr.write("acc2mp-cc: error: %s\n" % e)
+        status = 1
+    sys.exit(status)
@@ -0,0 +1,315 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Batch translation of source trees on a pool of processes
+# -----------------------------------------------------------------------------
+
+import collections
+import concurrent.futures
+import glob
+import io
+import mmap
+import os
+import sys
+import time
+
+import parser
+from diagnostics import Diagnostics
+from stats import TranslationStats
+
+# Extensions of the files translated when a directory or a pattern is given
+EXTENSIONS = ('.c', '.h', '.cpp')
+
+# Return: Directory of 'pattern' that does not contain wildcards
+def _glob_base(pattern):
+    base = []
+    for part in pattern.split(os.sep):
+        if glob.has_magic(part):
+            break
+        base.append(part)
+    return os.sep.join(base) or '.'
+
+# Return: True if 'path' is the directory 'directory', a real path, or is
+# inside it
+def _inside(path, directory):
+    path = os.path.realpath(path)
+    return path == directory or path.startswith(os.path.join(directory, ''))
+
+# Return: List of tuples, first element is the path of a file to translate and
+# the second element is its path relative to the output directory. Files
+# inside a directory keep their path relative to that directory, files
+# matched by a pattern keep their path relative to the part of the pattern
+# without wildcards and files given by name go to the output directory. A
+# file found more than once is only translated the first time. Nothing
+# inside the directory 'exclude', usually the output directory, is found so
+# that translations are not translated again
+def find_sources(paths, exclude=None):
+    if exclude is not None:
+        exclude = os.path.realpath(exclude)
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                if exclude is not None:
+                    if _inside(root, exclude):
+                        dirs[:] = []
+                        continue
+                    dirs[:] = [name for name in dirs
+                               if not _inside(os.path.join(root, name),
+                                              exclude)]
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(EXTENSIONS):
+                        source = os.path.join(root, name)
+                        found.append((source, os.path.relpath(source, path)))
+        elif glob.has_magic(path):
+            base = _glob_base(path)
+            for source in sorted(glob.glob(path, recursive=True)):
+                if os.path.isfile(source) and source.endswith(EXTENSIONS):
+                    found.append((source, os.path.relpath(source, base)))
+        else:
+            found.append((path, os.path.basename(path)))
+    sources = []
+    seen = set()
+    for source, relative in found:
+        if exclude is not None and _inside(source, exclude):
+            continue
+        if os.path.abspath(source) not in seen:
+            seen.add(os.path.abspath(source))
+            sources.append((source, relative))
+    return sources
+
+# Raise ValueError when two of the 'sources', tuples as find_sources gives
+# them, would be translated into the same file of the output directory, as
+# two files of the same name given by name would
+def check_outputs(sources):
+    outputs = {}
+    for source, relative in sources:
+        output = os.path.normcase(os.path.normpath(relative))
+        if output in outputs:
+            raise ValueError("%s and %s would both be translated into %s"
+                             % (outputs[output], source, relative))
+        outputs[output] = source
+
+# Translate the file 'src' into the file 'dst', through 'cache' when it is
+# given. 'use_mmap' selects parser.translate_mmap instead of
+# parser.translate_file.
+# Return: Tuple with the source, the destination, the number of bytes read,
+# the time spent, whether the translation came from the cache, the error
+# message (None when the translation succeeded), the TranslationStats of
+# the translation when 'collect_stats' is true and, when 'fail_soft' is true,
+# the Diagnostics of the pragmas left untranslated instead of failing
+def translate_one(src, dst, cache=None, use_mmap=False, collect_stats=False,
+                  fail_soft=False):
+    start = time.perf_counter()
+    error = None
+    size = 0
+    cached = False
+    stats = TranslationStats() if collect_stats else None
+    diagnostics = Diagnostics(src) if fail_soft else None
+    translate = parser.translate_mmap if use_mmap else parser.translate_file
+    try:
+        size = os.path.getsize(src)
+        directory = os.path.dirname(dst)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if cache is not None:
+            cached = cache.translate_file(src, dst, translate, stats,
+                                          diagnostics)
+        else:
+            translate(src, dst, stats, diagnostics)
+    except (OSError, SyntaxError, UnicodeError) as e:
+        error = str(e)
+    return (src, dst, size, time.perf_counter() - start, cached, error, stats,
+            diagnostics)
+
+# Return: String telling how many pragmas of a file were left untranslated
+# according to its Diagnostics 'diagnostics', empty when there are none
+def untranslated_note(diagnostics):
+    if not diagnostics:
+        return ""
+    return " (%d pragmas left untranslated)" % len(diagnostics)
+
+# Translate every file found in 'paths', outside 'output_dir', into
+# 'output_dir' using 'jobs' processes. Each process builds the lexer and the
+# parser once and uses them for all the files it translates. The hits and
+# misses of the workers are added to 'cache' and their TranslationStats to
+# 'stats'. When the
+# Diagnostics 'diagnostics' is given, the pragmas that cannot be translated
+# are left as they are and recorded there. A line is printed for each file
+# and the aggregate throughput at the end. ValueError is raised, before
+# anything is translated, when two files would have the same translation
+# path.
+# Return: Number of files that could not be translated
+def translate_tree(paths, output_dir, jobs=None, cache=None, use_mmap=False,
+                   stats=None, out=sys.stdout, diagnostics=None):
+    sources = find_sources(paths, output_dir)
+    check_outputs(sources)
+    start = time.perf_counter()
+    failures = 0
+    total = 0
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=parser.get_parser) as executor:
+        futures = [executor.submit(translate_one, src,
+                                   os.path.join(output_dir, relative),
+                                   cache, use_mmap, stats is not None,
+                                   diagnostics is not None)
+                   for src, relative in sources]
+        for future in futures:
+            (src, dst, size, elapsed, cached, error, file_stats,
+             file_diagnostics) = future.result()
+            total += size
+            if file_stats is not None:
+                stats.merge(file_stats)
+            if file_diagnostics is not None:
+                diagnostics.merge(file_diagnostics)
+            if cache is not None and error is None:
+                if cached:
+                    cache.hits += 1
+                else:
+                    cache.misses += 1
+            if error is None:
+                out.write("%8.3fs %12d B  %s -> %s%s%s\n" % (elapsed, size,
+                          src, dst, " (cached)" if cached else "",
+                          untranslated_note(file_diagnostics)))
+            else:
+                failures += 1
+                out.write("  FAILED %12d B  %s: %s\n" % (size, src, error))
+    elapsed = time.perf_counter() - start
+    out.write("%d files (%d failed), %.1f MB in %.3fs: %.1f MB/s, %.1f files/s\n"
+              % (len(sources), failures, total / 1e6, elapsed,
+                 total / 1e6 / elapsed if elapsed else 0.0,
+                 len(sources) / elapsed if elapsed else 0.0))
+    return failures
+
+# Size of the pieces a file is split into to translate it on several
+# processes, and smallest size of a piece
+PARALLEL_CHUNK = 8 << 20
+PARALLEL_MIN_CHUNK = 1 << 20
+
+# Number of bytes of a memory-mapped file copied at once to be counted
+COUNT_BLOCK = 1 << 24
+
+# Return: Number of times the bytes 'sub' start between the positions 'start'
+# and 'end' of the bytes 'data', a memory-mapped file, counted a block at a
+# time
+def _count(data, sub, start, end):
+    count = 0
+    for pos in range(start, end, COUNT_BLOCK):
+        stop = min(pos + COUNT_BLOCK, end)
+        count += data[pos:min(stop + len(sub) - 1, len(data))].count(sub)
+    return count
+
+# Return: Tuple with the positions of the file 'src' where the piece cut
+# near the positions 'start' and 'end' begins and ends, as
+# parser.split_point finds them, its translation, its TranslationStats when
+# 'collect_stats' is true and its Diagnostics when 'fail_soft' is true. The
+# file has 'lineno' lines before 'start'. The bytes are decoded as
+# parser.translate_file reads them
+def _translate_piece(src, start, end, lineno, collect_stats, fail_soft):
+    stats = TranslationStats() if collect_stats else None
+    diagnostics = Diagnostics(src) if fail_soft else None
+    with open(src, 'rb') as input_file, \
+         mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        first = parser.split_point(data, start)
+        last = max(first, parser.split_point(data, end)
+                   if end < len(data) else end)
+        lineno += _count(data, b'\n', start, first) + 1
+        piece = data[first:last]
+    with io.TextIOWrapper(io.BytesIO(piece), encoding=parser.MMAP_ENCODING,
+                          errors='surrogateescape') as piece:
+        text = piece.read()
+    return (first, last, parser.translate(text, stats, lineno=lineno,
+                                          diagnostics=diagnostics),
+            stats, diagnostics)
+
+# Translate the file 'src' into the file 'dst' using 'jobs' processes. The
+# file is cut in pieces of about the same size near the beginning of lines,
+# and each process finds where its piece really begins and ends, outside of
+# the pragmas and of the regions, so this process only counts the lines
+# before the cuts. The pieces are translated apart and written in order, so
+# the output is the one of parser.translate_file. Small files, files with
+# carriage returns not followed by a new line, and files whose pieces
+# overlap, are translated by this process. The TranslationStats of the
+# pieces are added to 'stats' when it is given, the times are the sum of the
+# times of the processes. 'diagnostics' is used as by parser.translate_file
+def translate_parallel(src, dst, jobs=None, stats=None, diagnostics=None):
+    jobs = jobs or os.cpu_count() or 1
+    with open(src, 'rb') as input_file:
+        size = os.fstat(input_file.fileno()).st_size
+        parts = min(max(jobs, size // PARALLEL_CHUNK),
+                    size // PARALLEL_MIN_CHUNK)
+        if jobs < 2 or parts < 2:
+            parser.translate_file(src, dst, stats, diagnostics)
+            return
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # The text mode turns the lone carriage returns into new lines
+            if data.find(b'\r') >= 0 and _count(data, b'\r', 0, size) != \
+                    _count(data, b'\r\n', 0, size):
+                parser.translate_file(src, dst, stats, diagnostics)
+                return
+            cuts = [0]
+            lines = [0]
+            for part in range(1, parts):
+                cut = data.find(b'\n', size * part // parts - 1) + 1
+                if cut > cuts[-1]:
+                    lines.append(lines[-1] +
+                                 _count(data, b'\n', cuts[-1], cut))
+                    cuts.append(cut)
+    pieces = list(zip(cuts, cuts[1:] + [size], lines))
+    # The pieces are gathered apart and only added at the end, when they did
+    # not have to be translated again by this process
+    piece_stats = TranslationStats() if stats is not None else None
+    piece_diagnostics = Diagnostics(src) if diagnostics is not None else None
+    with open(dst, 'w', encoding=parser.MMAP_ENCODING,
+              errors='surrogateescape') as output_file, \
+         concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=parser.get_parser) as executor:
+        # A few pieces ahead of the one written are translated at once, so
+        # the translations waiting to be written stay few
+        pending = collections.deque()
+        written = 0
+        for start, end, lineno in pieces:
+            pending.append(executor.submit(_translate_piece, src, start, end,
+                                           lineno, stats is not None,
+                                           diagnostics is not None))
+            if len(pending) > 2 * jobs and written >= 0:
+                written = _write_piece(pending.popleft(), written,
+                                       output_file, piece_stats,
+                                       piece_diagnostics)
+        while pending and written >= 0:
+            written = _write_piece(pending.popleft(), written, output_file,
+                                   piece_stats, piece_diagnostics)
+        for future in pending:
+            future.cancel()
+    if written < 0:
+        parser.translate_file(src, dst, stats, diagnostics)
+        return
+    if stats is not None:
+        stats.merge(piece_stats)
+        stats.files += 1
+    if diagnostics is not None:
+        diagnostics.merge(piece_diagnostics)
+
+# Write the translation of the piece of the future 'future' to 'output_file'
+# when it begins at the position 'written' where the previous one ended.
+# Return: Position where the piece ends, -1 when it does not follow the
+# previous one and nothing was written
+def _write_piece(future, written, output_file, stats, diagnostics):
+    first, last, text, piece_stats, piece_diagnostics = future.result()
+    if first != written:
+        return -1
+    output_file.write(text)
+    if piece_stats is not None:
+        stats.merge(piece_stats)
+    if piece_diagnostics is not None:
+        diagnostics.merge(piece_diagnostics)
+    return last
+
+# Return: Function with the arguments of parser.translate_file that
+# translates with translate_parallel on 'jobs' processes. It has the name of
+# parser.translate_file, so it shares its entries in a TranslationCache
+def parallel_translator(jobs):
+    def translate_file(src, dst, stats=None, diagnostics=None):
+        translate_parallel(src, dst, jobs, stats, diagnostics)
+    return translate_file
@@ -0,0 +1,96 @@
+# -----------------------------------------------------------------------------
+# Synthetic OpenACC corpora
+#
+# Generates C inputs for the benchmarks. The size of the input, the density
+# of pragmas, the length of their clause lists, the number of dimensions of
+# their subarrays and the use of continuation lines can be chosen.
+#
+# Usage: python benchmarks/corpus.py lines [density [clauses [nesting
+#        [continuation]]]] > input.c
+# -----------------------------------------------------------------------------
+
+import random
+import sys
+
+# Plain C lines written between the pragmas
+CODE = [
+    '    for (int i = 0; i < n; i++) {\n',
+    '        a[i] = b[i] * c[i] + d;\n',
+    '        s += x[i * n + j] % 3 && y || z;\n',
+    '    }\n',
+    '\tif (max(p, q) > min(r, t)) { u = v & w | k; } // comment\n',
+    '    double tmp = 0.0; /* accumulator */\n',
+    '\n',
+]
+
+CONSTRUCTS = ['parallel loop', 'parallel', 'loop', 'data']
+
+DATA_CLAUSES = ['copy', 'copyin', 'copyout', 'create']
+
+REDUCTION_OPERATORS = ['+', '*', '&', '|', '&&', '||']
+
+# Return: String with a variable name, taken from a pool of 'count' names
+def variable(rng, count=64):
+    return 'v%d' % rng.randrange(count)
+
+# Return: String with a variable, followed by 'nesting' subarray dimensions
+def data_var(rng, nesting):
+    bounds = ['[%s:%s]' % (rng.choice(['0', 'i', 'lo']),
+                           rng.choice(['n', 'm', 'n*2', 'n+1']))
+              for dimension in range(nesting)]
+    return variable(rng) + ''.join(bounds)
+
+# Return: String with a clause of the clause list of a pragma
+def clause(rng, nesting):
+    kind = rng.randrange(6)
+    if kind < 3:
+        count = rng.randint(1, 3)
+        return '%s(%s)' % (rng.choice(DATA_CLAUSES),
+                           ', '.join(data_var(rng, nesting) for i in range(count)))
+    if kind == 3:
+        return 'reduction(%s:%s)' % (rng.choice(REDUCTION_OPERATORS), variable(rng))
+    if kind == 4:
+        return rng.choice(['collapse(2)', 'vector(%d)' % rng.choice([4, 8, 32]),
+                           'num_workers(%d)' % rng.choice([2, 4, 8])])
+    return rng.choice(['gang', 'vector', 'independent'])
+
+# Return: String with a pragma with 'clauses' clauses. Each clause goes on its
+# own continuation line with probability 'continuation'
+def pragma(rng, clauses, nesting, continuation):
+    construct = rng.choice(CONSTRUCTS)
+    text = '    #pragma acc ' + construct
+    for i in range(clauses):
+        separator = ' \\\n        ' if rng.random() < continuation else ' '
+        text += separator + clause(rng, nesting)
+    return text + '\n'
+
+# Return: Tuple with the C input of 'lines' lines and the number of pragmas
+# in it. 'density' is the fraction of the lines starting a pragma
+def generate(lines, density=0.01, clauses=3, nesting=1, continuation=0.0,
+             seed=0):
+    rng = random.Random(seed)
+    output = []
+    count = 0
+    pragmas = 0
+    while count < lines:
+        if rng.random() < density:
+            text = pragma(rng, clauses, nesting, continuation)
+            pragmas += 1
+        else:
+            text = rng.choice(CODE)
+        output.append(text)
+        count += text.count('\n')
+    return ''.join(output), pragmas
+
+if __name__ == '__main__':
+
+    if len(sys.argv) < 2:
+        print(__doc__ or "Usage: corpus.py lines [density [clauses [nesting "
+              "[continuation]]]]")
+        sys.exit(1)
+
+    arguments = [int(sys.argv[1])] + [float(arg) for arg in sys.argv[2:3]]
+    arguments += [int(arg) for arg in sys.argv[3:5]]
+    arguments += [float(arg) for arg in sys.argv[5:6]]
+    text, pragmas = generate(*arguments)
+    sys.stdout.write(text)
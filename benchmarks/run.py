@@ -0,0 +1,198 @@
+# -----------------------------------------------------------------------------
+# Benchmark suite
+#
+# Translates synthetic corpora of different shapes and reports the lines and
+# pragmas translated per second, the peak memory and the startup time of the
+# translator. The results are saved as JSON so runs on different commits can
+# be compared.
+#
+# Usage: python benchmarks/run.py [--quick] [--output results.json]
+#                                 [--compare previous.json]
+# -----------------------------------------------------------------------------
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import corpus
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Each case is a tuple with its name and the arguments of corpus.generate:
+# lines, pragma density, clauses per pragma, subarray dimensions and
+# probability of a continuation line between clauses
+CASES = [
+    ('size-1k',           (1000,    0.01, 3, 1, 0.0)),
+    ('size-10k',          (10000,   0.01, 3, 1, 0.0)),
+    ('size-100k',         (100000,  0.01, 3, 1, 0.0)),
+    ('size-1M',           (1000000, 0.01, 3, 1, 0.0)),
+    ('density-0',         (100000,  0.0,  3, 1, 0.0)),
+    ('density-10%',       (100000,  0.1,  3, 1, 0.0)),
+    ('density-50%',       (100000,  0.5,  3, 1, 0.0)),
+    ('clauses-1',         (100000,  0.05, 1, 1, 0.0)),
+    ('clauses-16',        (100000,  0.05, 16, 1, 0.0)),
+    ('nesting-3',         (100000,  0.05, 3, 3, 0.0)),
+    ('nesting-6',         (100000,  0.05, 3, 6, 0.0)),
+    ('continuation-50%',  (100000,  0.05, 3, 1, 0.5)),
+    ('continuation-100%', (100000,  0.05, 3, 1, 1.0)),
+]
+
+# Cases of the quick run
+QUICK_CASES = ['size-1k', 'size-10k', 'density-10%', 'clauses-16',
+               'nesting-3', 'continuation-50%']
+
+# Number of runs of the startup measure
+STARTUP_RUNS = 10
+
+# Return: Peak resident memory of this process in KB. Linux keeps the
+# ru_maxrss of the parent across exec, so VmHWM is used when it is available
+def peak_rss():
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+# Translate 'src' into 'dst' in this process with the translation function
+# 'mode' of the parser module and print the time spent and the peak memory
+def child(src, dst, mode):
+    sys.path.insert(0, ROOT)
+    import parser
+    translate = getattr(parser, mode)
+    start = time.perf_counter()
+    parser.get_parser()
+    translate(src, dst)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'seconds': elapsed, 'peak_rss_kb': peak_rss()}))
+
+# Return: Dictionary with the results of translating the corpus of 'case'
+# in a fresh process
+def run_case(case, directory, mode):
+    name, arguments = case
+    text, pragmas = corpus.generate(*arguments)
+    src = os.path.join(directory, name + '.c')
+    dst = os.path.join(directory, name + '.out.c')
+    with open(src, 'w') as input_file:
+        input_file.write(text)
+    process = subprocess.run([sys.executable, os.path.abspath(__file__),
+                              '--child', src, dst, mode],
+                             check=True, stdout=subprocess.PIPE,
+                             universal_newlines=True)
+    result = json.loads(process.stdout)
+    lines = text.count('\n')
+    result.update({
+        'name': name,
+        'lines': lines,
+        'pragmas': pragmas,
+        'bytes': len(text),
+        'lines_per_sec': lines / result['seconds'],
+        'pragmas_per_sec': pragmas / result['seconds'],
+    })
+    os.remove(src)
+    os.remove(dst)
+    return result
+
+# Return: Dictionary with the best and median wall time of translating a
+# small file with a fresh 'parser.py' process
+def run_startup(directory):
+    src = os.path.join(directory, 'startup.c')
+    dst = os.path.join(directory, 'startup.out.c')
+    with open(src, 'w') as input_file:
+        input_file.write(corpus.generate(20, 0.1)[0])
+    times = []
+    for i in range(STARTUP_RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(ROOT, 'parser.py'),
+                        src, dst], check=True)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {'best_seconds': times[0], 'median_seconds': times[len(times) // 2]}
+
+# Return: String with the git commit of the sources, None outside git
+def commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL,
+                                       universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Print the ratio of the throughput of the cases in 'results' to the ones in
+# 'previous'
+def compare(results, previous):
+    before = dict((case['name'], case) for case in previous['cases'])
+    print("\nCompared to %s:" % (previous.get('commit') or 'previous run'))
+    for case in results['cases']:
+        if case['name'] in before:
+            ratio = case['lines_per_sec'] / before[case['name']]['lines_per_sec']
+            print("%-20s %6.2fx lines/s" % (case['name'], ratio))
+    ratio = (previous['startup']['best_seconds'] /
+             results['startup']['best_seconds'])
+    print("%-20s %6.2fx" % ('startup', ratio))
+
+if __name__ == '__main__':
+
+    argparser = argparse.ArgumentParser(description='Run the benchmarks')
+    argparser.add_argument('--quick', action='store_true',
+        help='only run the small cases')
+    argparser.add_argument('--case', action='append',
+        help='run this case, can be given more than once')
+    argparser.add_argument('--mode', default='translate_file',
+        choices=['translate_file', 'translate_mmap'],
+        help='translation function used (default: translate_file)')
+    argparser.add_argument('--output', help='write the results to this file')
+    argparser.add_argument('--compare', help='results of a previous run')
+    argparser.add_argument('--child', nargs=3, help=argparse.SUPPRESS)
+    args = argparser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        sys.exit(0)
+
+    names = args.case or (QUICK_CASES if args.quick else
+                          [name for name, arguments in CASES])
+    unknown = set(names) - set(name for name, arguments in CASES)
+    if unknown:
+        argparser.error("unknown cases: %s" % ", ".join(sorted(unknown)))
+
+    results = {
+        'commit': commit(),
+        'python': platform.python_version(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'mode': args.mode,
+        'cases': [],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        results['startup'] = run_startup(directory)
+        print("startup: best %.3fs, median %.3fs"
+              % (results['startup']['best_seconds'],
+                 results['startup']['median_seconds']))
+        print("%-20s %9s %8s %9s %12s %12s %10s" % ("case", "lines", "pragmas",
+              "seconds", "lines/s", "pragmas/s", "RSS (MB)"))
+        for case in CASES:
+            if case[0] not in names:
+                continue
+            result = run_case(case, directory, args.mode)
+            results['cases'].append(result)
+            print("%-20s %9d %8d %9.3f %12.0f %12.0f %10.1f"
+                  % (result['name'], result['lines'], result['pragmas'],
+                     result['seconds'], result['lines_per_sec'],
+                     result['pragmas_per_sec'], result['peak_rss_kb'] / 1024))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as previous_file:
+            compare(results, json.load(previous_file))
@@ -0,0 +1,38 @@
+# -----------------------------------------------------------------------------
+# Scaling of the grammar with the input size
+#
+# Parses inputs of growing size through the whole grammar (without the pragma
+# fast path of translate) and prints the time spent per line, which must stay
+# roughly constant when the input grows.
+#
+# Usage: python benchmarks/scaling.py [lines ...]
+# -----------------------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import corpus
+import parser
+
+# Fraction of the lines starting a pragma
+DENSITY = 0.02
+
+if __name__ == '__main__':
+
+    if len(sys.argv) > 1:
+        sizes = [int(arg) for arg in sys.argv[1:]]
+    else:
+        sizes = [12500, 25000, 50000, 100000]
+
+    parser.get_parser()
+
+    print("%10s %10s %14s" % ("lines", "seconds", "us/line"))
+    for lines in sizes:
+        text, pragmas = corpus.generate(lines, DENSITY)
+        start = time.perf_counter()
+        parser._parse(text)
+        elapsed = time.perf_counter() - start
+        print("%10d %10.3f %14.2f" % (lines, elapsed, elapsed / lines * 1e6))
@@ -0,0 +1,211 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Content-addressed cache of translated files
+# -----------------------------------------------------------------------------
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+import emitter
+import ir
+import lexer
+import merge
+import parser
+
+# Default size limit of a cache directory, in bytes
+DEFAULT_MAX_SIZE = 1 << 30
+
+# Modules whose source decides the translation of a file
+TRANSLATOR_MODULES = (parser, lexer, ir, emitter, merge)
+
+# Hash of the source of TRANSLATOR_MODULES, computed on first use
+_translator_signature = None
+
+# Return: String with the hash of the source of the modules that translate the
+# files, so the entries written by another version of the translator are
+# never used
+def translator_signature():
+    global _translator_signature
+    if _translator_signature is None:
+        digest = hashlib.sha256()
+        for module in TRANSLATOR_MODULES:
+            with open(module.__file__, 'rb') as source:
+                digest.update(source.read() + b'\0')
+        _translator_signature = digest.hexdigest()
+    return _translator_signature
+
+# Prefix of the files being written to the cache directory
+TEMP_PREFIX = 'tmp-'
+
+# Name of the file of the cache directory with the running total of the sizes
+# of the entries, so a miss does not scan the directory
+SIZE_FILE = 'size'
+
+# Fraction of the size limit that the eviction brings the cache down to, so
+# the directory is only scanned again once that much was added
+EVICT_TARGET = 0.9
+
+# Translations stored in a directory, one file per translation named by the
+# hash of the input, of the grammar signature and of the target. Every hit
+# touches the file, so its modification time tells when it was last used and
+# the least recently used files are removed first when the running total of
+# their sizes grows past 'max_size' bytes
+class TranslationCache(object):
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    # Return: String with the key of the file 'src'. 'variant' tells apart
+    # translation modes that give different outputs for the same input, as
+    # the target of the emitter does, and the signatures tell apart the
+    # versions of the grammar and of the translator
+    def key(self, src, variant=''):
+        digest = hashlib.sha256()
+        digest.update(parser.grammar_signature().encode())
+        digest.update(translator_signature().encode())
+        digest.update(b'\0' + variant.encode() + b'\0' +
+                      emitter.target.encode() + b'\0')
+        with open(src, 'rb') as input_file:
+            for block in iter(lambda: input_file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    # Return: Path of the cache entry of 'key'
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    # Translate the file 'src' into the file 'dst' with the function
+    # 'translate', unless the translation is already in the cache. 'stats'
+    # and 'diagnostics' are given to 'translate'. A translation that left
+    # pragmas untranslated is not stored, a hit would lose its diagnostics.
+    # Return: True when the translation came from the cache
+    def translate_file(self, src, dst, translate=None, stats=None,
+                       diagnostics=None):
+        if translate is None:
+            translate = parser.translate_file
+        key = self.key(src, translate.__name__)
+        path = self.path(key)
+        try:
+            entry = open(path, 'rb')
+        except FileNotFoundError:
+            pass
+        else:
+            with entry, open(dst, 'wb') as output_file:
+                shutil.copyfileobj(entry, output_file)
+            self._touch(path)
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        untranslated = len(diagnostics) if diagnostics is not None else 0
+        translate(src, dst, stats, diagnostics)
+        if diagnostics is None or len(diagnostics) == untranslated:
+            self._add_size(self._store(dst, path))
+        return False
+
+    # Mark the entry 'path' as used now
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            pass
+
+    # Write the file 'path' of the cache directory with the function 'write',
+    # given the file object opened in binary mode. The file is written to a
+    # temporary file first so other processes never see a partial file
+    def _write(self, path, write):
+        fd, temp = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as output_file:
+                write(output_file)
+            os.replace(temp, path)
+        except BaseException:
+            os.remove(temp)
+            raise
+
+    # Copy the file 'src' to the entry 'path'
+    # Return: Size of the entry in bytes
+    def _store(self, src, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(src, 'rb') as input_file:
+            self._write(path, lambda entry:
+                        shutil.copyfileobj(input_file, entry))
+            return input_file.tell()
+
+    # Return: Running total of the sizes of the entries, None when it was
+    # never recorded
+    def _recorded_size(self):
+        try:
+            with open(os.path.join(self.directory, SIZE_FILE)) as size_file:
+                return int(size_file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    # Record 'size' as the running total of the sizes of the entries
+    def _record_size(self, size):
+        self._write(os.path.join(self.directory, SIZE_FILE),
+                    lambda size_file: size_file.write(b'%d\n' % size))
+
+    # Add 'size' bytes to the running total and evict entries when it grows
+    # past 'max_size'. Processes that store at the same time may lose some of
+    # their updates, the scan of the eviction sets the total right again
+    def _add_size(self, size):
+        total = self._recorded_size()
+        if total is None or total + size > self.max_size:
+            self.evict()
+        else:
+            self._record_size(total + size)
+
+    # Return: List of tuples with the modification time, the size and the
+    # path of every entry
+    def entries(self):
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            directory = os.path.join(self.directory, name)
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    # Scan the cache directory and, when it does not fit in 'max_size' bytes,
+    # remove the least recently used entries until it fits in EVICT_TARGET
+    # of it. The size left is recorded as the running total
+    def evict(self):
+        if not os.path.isdir(self.directory):
+            return
+        entries = self.entries()
+        size = sum(entry[1] for entry in entries)
+        if size > self.max_size:
+            entries.sort()
+            for mtime, entry_size, path in entries:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                size -= entry_size
+                if size <= self.max_size * EVICT_TARGET:
+                    break
+        self._record_size(size)
+
+    # Return: String with the number of entries, the size of the cache and
+    # the hits and misses counted by this object
+    def report(self):
+        entries = self.entries()
+        size = sum(entry[1] for entry in entries)
+        return ("cache %s: %d entries, %.1f MB of %.1f MB, %d hits, %d misses"
+                % (self.directory, len(entries), size / 1e6,
+                   self.max_size / 1e6, self.hits, self.misses))
@@ -0,0 +1,189 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Client of the translation daemon, used in place of 'parser.py in out'
+# -----------------------------------------------------------------------------
+
+import argparse
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+
+import emitter
+from diagnostics import Diagnostic, Diagnostics
+
+# Environment variable holding the path of the socket of the daemon
+SOCKET_VARIABLE = 'ACC2OMP_SOCKET'
+
+# Encoding of the texts sent to and received from the daemon
+ENCODING = 'utf-8'
+
+# Return: Path of the socket of the daemon, taken from the environment or by
+# default a path of the runtime directory of the user, $XDG_RUNTIME_DIR, or
+# of a directory of the temporary directory that only the user can use
+def default_socket():
+    path = os.environ.get(SOCKET_VARIABLE)
+    if path:
+        return path
+    directory = os.environ.get('XDG_RUNTIME_DIR')
+    if not directory:
+        directory = os.path.join(tempfile.gettempdir(),
+                                 'acc2omp-%d' % os.getuid())
+    return os.path.join(directory, 'acc2omp.sock')
+
+# Raise PermissionError when the directory 'directory' lets another user
+# replace the files it holds: it belongs to another user than this one and
+# root, or others may write to it without the sticky bit that keeps them
+# from removing the files of this user
+def check_directory(directory):
+    info = os.stat(directory)
+    if info.st_uid not in (os.getuid(), 0):
+        raise PermissionError('%s belongs to another user' % directory)
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and \
+            not info.st_mode & stat.S_ISVTX:
+        raise PermissionError('%s can be written by other users' % directory)
+
+# Raise PermissionError when the socket 'path' may not be the one of a daemon
+# of this user: it belongs to another user or its directory does, as
+# check_directory tells. FileNotFoundError is raised when it does not exist
+def check_socket(path):
+    check_directory(os.path.dirname(os.path.abspath(path)))
+    if os.lstat(path).st_uid != os.getuid():
+        raise PermissionError('%s belongs to another user' % path)
+
+# Send the dictionary 'header' and the bytes 'payload' to the daemon
+# listening on 'path'.
+# Return: Tuple with the dictionary answered by the daemon and the bytes that
+# follow it. OSError is raised when the daemon cannot be reached and
+# PermissionError when the socket may belong to another user
+def request(header, payload=b'', path=None):
+    path = path or default_socket()
+    check_socket(path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(header).encode(ENCODING) + b'\n' + payload)
+        with sock.makefile('rb') as answer:
+            line = answer.readline()
+            if not line:
+                raise ConnectionError('The daemon closed the connection')
+            response = json.loads(line.decode(ENCODING))
+            data = answer.read(response.get('size', 0))
+    return response, data
+
+# Return: Tuple with the dictionary answered by the daemon and the bytes that
+# follow it, for the translation of the file 'src' into the file 'dst', or
+# into the bytes when 'dst' is None. With 'strict', the translation fails on
+# the first pragma that cannot be translated instead of leaving it as it is.
+# 'target' is the target of the emitter, by default the one of the daemon
+def translate_file(src, dst=None, use_mmap=False, path=None, strict=False,
+                   target=None):
+    header = {'input': os.path.abspath(src), 'strict': strict}
+    if target is not None:
+        header['target'] = target
+    if dst is not None:
+        header['output'] = os.path.abspath(dst)
+        header['mmap'] = use_mmap
+    return request(header, path=path)
+
+# Return: Tuple with the dictionary answered by the daemon and the bytes that
+# follow it, for the translation of the string 'text'
+def translate(text, path=None, strict=False, target=None):
+    payload = text.encode(ENCODING, 'surrogateescape')
+    header = {'size': len(payload), 'strict': strict}
+    if target is not None:
+        header['target'] = target
+    return request(header, payload, path)
+
+# Return: Diagnostics of the list of dictionaries 'entries' answered by the
+# daemon
+def diagnostics_of(entries):
+    diagnostics = Diagnostics()
+    for entry in entries:
+        diagnostics.entries.append(Diagnostic(entry['file'], entry['line'],
+                                              entry['pragma'], entry['error']))
+    return diagnostics
+
+# Translate the file 'src' in this process, when the daemon is not running.
+# 'diagnostics' is used as by parser.translate_file
+def _translate_here(src, dst, use_mmap, diagnostics):
+    import parser
+    if dst is None:
+        with open(src, 'r') as input_file:
+            parser.translate_stream(input_file, sys.stdout, None, diagnostics)
+        return
+    translate_function = parser.translate_mmap if use_mmap else \
+        parser.translate_file
+    translate_function(src, dst, None, diagnostics)
+    os.chmod(dst, 0o666)
+
+if __name__ == '__main__':
+
+    argparser = argparse.ArgumentParser(
+        description='Translate the OpenACC pragmas of a C file to OpenMP '
+                    'with the translation daemon. The file is translated by '
+                    'this process when the daemon is not running')
+    argparser.add_argument('input', nargs='?', help='file to translate')
+    argparser.add_argument('output', nargs='?',
+        help="file where the translation is written, '-' or omitted for the "
+             "standard output")
+    argparser.add_argument('--mmap', action='store_true',
+        help='map the input in memory and copy the lines without pragmas '
+             'byte for byte to the output file')
+    argparser.add_argument('--strict', action='store_true',
+        help='stop at the first pragma that cannot be translated, instead of '
+             'leaving it untranslated and going on')
+    argparser.add_argument('--diagnostics', metavar='FILE',
+        help='write the pragmas left untranslated to this file, one JSON '
+             'object per line')
+    argparser.add_argument('--target', choices=emitter.TARGETS,
+        help='where the compute constructs run (default: the target of the '
+             'daemon, %s without daemon)' % emitter.target)
+    argparser.add_argument('--socket',
+        help='path of the socket of the daemon (default: $%s or %s)'
+             % (SOCKET_VARIABLE, default_socket()))
+    argparser.add_argument('--ping', action='store_true',
+        help='exit with success when the daemon is running')
+    argparser.add_argument('--stop', action='store_true',
+        help='stop the daemon')
+    args = argparser.parse_args()
+
+    if args.ping or args.stop:
+        try:
+            request({'command': 'stop' if args.stop else 'ping'},
+                    path=args.socket)
+        except OSError as e:
+            sys.exit('No daemon on %s: %s' % (args.socket or default_socket(), e))
+        sys.exit(0)
+
+    if args.input is None:
+        argparser.error("an input file is needed")
+    output = None if args.output in (None, '-') else args.output
+    if args.mmap and output is None:
+        argparser.error("--mmap needs an output file")
+    if args.strict and args.diagnostics is not None:
+        argparser.error("--diagnostics cannot be used with --strict")
+
+    try:
+        response, data = translate_file(args.input, output, args.mmap,
+                                        args.socket, args.strict, args.target)
+    except PermissionError as e:
+        sys.exit(str(e))
+    except (FileNotFoundError, ConnectionRefusedError):
+        diagnostics = None if args.strict else Diagnostics(args.input)
+        if args.target is not None:
+            emitter.set_target(args.target)
+        _translate_here(args.input, output, args.mmap, diagnostics)
+    else:
+        if not response['ok']:
+            sys.exit(response['error'])
+        if output is None:
+            sys.stdout.buffer.write(data)
+        diagnostics = diagnostics_of(response.get('diagnostics', []))
+    if diagnostics is not None:
+        diagnostics.report(sys.stderr)
+        if args.diagnostics is not None:
+            with open(args.diagnostics, 'w') as diagnostics_file:
+                diagnostics.write_json(diagnostics_file)
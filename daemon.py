@@ -0,0 +1,238 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Translation daemon listening on a Unix domain socket
+# -----------------------------------------------------------------------------
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import signal
+import socket
+import sys
+
+import batch
+import client
+import emitter
+import parser
+from diagnostics import Diagnostics
+
+# A request is a line holding a JSON object, followed by 'size' bytes when
+# the object has a 'size':
+#   {"input": path, "output": path, "mmap": bool}  translate a file to a file
+#   {"input": path}                               translate a file
+#   {"size": n}                                   translate the n bytes
+#   {"command": "ping"} or {"command": "stop"}
+# A translation request with "strict": true fails on the first pragma that
+# cannot be translated, otherwise such pragmas are left as they are. Its
+# "target" selects the target of the emitter, by default the one of the
+# daemon.
+# The answer is a line holding {"ok": true} or {"ok": false, "error": message},
+# with a 'size' and the translated bytes when no output file was given and a
+# list of 'diagnostics' when pragmas were left untranslated
+
+# Return: List of the dictionaries of the Diagnostics 'diagnostics'
+def _diagnostic_list(diagnostics):
+    if diagnostics is None:
+        return []
+    return [diagnostic.as_dict() for diagnostic in diagnostics]
+
+# Return: Tuple with the bytes of the translation of the file 'src' for
+# 'target' and the list of the pragmas left untranslated when 'strict' is
+# false
+def _translate_path(src, strict, target):
+    emitter.set_target(target)
+    diagnostics = None if strict else Diagnostics(src)
+    with open(src, 'r') as input_file:
+        text = input_file.read()
+    result = parser.translate(text, diagnostics=diagnostics)
+    return (result.encode(client.ENCODING, 'surrogateescape'),
+            _diagnostic_list(diagnostics))
+
+# Return: Tuple with the bytes of the translation of the bytes 'data' for
+# 'target' and the list of the pragmas left untranslated when 'strict' is
+# false
+def _translate_bytes(data, strict, target):
+    emitter.set_target(target)
+    diagnostics = None if strict else Diagnostics()
+    text = data.decode(client.ENCODING, 'surrogateescape')
+    result = parser.translate(text, diagnostics=diagnostics)
+    return (result.encode(client.ENCODING, 'surrogateescape'),
+            _diagnostic_list(diagnostics))
+
+# Return: Tuple with the error message of the translation of the file 'src'
+# into the file 'dst' for 'target', None when it succeeded, whether the
+# translation came from 'cache' and the list of the pragmas left
+# untranslated when 'strict' is false
+def _translate_to_file(src, dst, cache, use_mmap, strict, target):
+    emitter.set_target(target)
+    result = batch.translate_one(src, dst, cache, use_mmap,
+                                 fail_soft=not strict)
+    cached, error = result[4], result[5]
+    if error is None:
+        os.chmod(dst, 0o666)
+    return error, cached, _diagnostic_list(result[7])
+
+# Translations served from a pool of processes that keep the lexer, the
+# parser and the pragmas already seen between the requests
+class TranslationDaemon(object):
+
+    def __init__(self, path=None, jobs=None, cache=None, out=sys.stderr,
+                 target=emitter.target):
+        self.path = path or client.default_socket()
+        self.target = target
+        self.jobs = jobs
+        self.cache = cache
+        self.out = out
+        self.requests = 0
+        self.failures = 0
+
+    # Return: Tuple with the dictionary of the answer to 'header' and the
+    # bytes that follow it
+    async def answer(self, header, reader, executor):
+        loop = asyncio.get_running_loop()
+        strict = header.get('strict', False)
+        target = header.get('target', self.target)
+        try:
+            if 'output' in header:
+                error, cached, diagnostics = await loop.run_in_executor(
+                    executor, _translate_to_file, header['input'],
+                    header['output'], self.cache, header.get('mmap', False),
+                    strict, target)
+                if error is not None:
+                    return {'ok': False, 'error': error}, b''
+                if self.cache is not None:
+                    if cached:
+                        self.cache.hits += 1
+                    else:
+                        self.cache.misses += 1
+                response, data = {'ok': True}, b''
+            else:
+                if 'input' in header:
+                    data, diagnostics = await loop.run_in_executor(
+                        executor, _translate_path, header['input'], strict,
+                        target)
+                else:
+                    payload = await reader.readexactly(header['size'])
+                    data, diagnostics = await loop.run_in_executor(
+                        executor, _translate_bytes, payload, strict, target)
+                response = {'ok': True, 'size': len(data)}
+        except (OSError, SyntaxError, ValueError) as e:
+            return {'ok': False, 'error': str(e)}, b''
+        if diagnostics:
+            response['diagnostics'] = diagnostics
+        return response, data
+
+    # Answer the requests of a client until it closes the connection
+    async def handle(self, reader, writer, executor, stop):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                header = json.loads(line.decode(client.ENCODING))
+                command = header.get('command')
+                if command is not None:
+                    response, data = {'ok': command in ('ping', 'stop')}, b''
+                    if command == 'stop':
+                        stop.set()
+                else:
+                    self.requests += 1
+                    response, data = await self.answer(header, reader, executor)
+                    if not response['ok']:
+                        self.failures += 1
+                        self.out.write("FAILED %s: %s\n"
+                                       % (header.get('input', '<buffer>'),
+                                          response['error']))
+                writer.write(json.dumps(response).encode(client.ENCODING)
+                             + b'\n' + data)
+                await writer.drain()
+                if command == 'stop':
+                    break
+        except (ValueError, KeyError, asyncio.IncompleteReadError,
+                ConnectionError) as e:
+            self.out.write("Bad request: %s\n" % e)
+        finally:
+            writer.close()
+
+    # Listen on the socket until a stop command, SIGINT or SIGTERM. The
+    # directory of the socket is created for this user only when it does not
+    # exist. PermissionError is raised when another user may replace the
+    # socket
+    async def run(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        client.check_directory(directory)
+        _remove_stale_socket(self.path)
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs, initializer=parser.get_parser) as executor:
+            server = await asyncio.start_unix_server(
+                lambda reader, writer: self.handle(reader, writer, executor,
+                                                   stop),
+                path=self.path)
+            self.out.write("Listening on %s\n" % self.path)
+            try:
+                async with server:
+                    await stop.wait()
+            finally:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+        self.out.write("%d requests (%d failed)\n"
+                       % (self.requests, self.failures))
+        if self.cache is not None:
+            self.out.write(self.cache.report() + "\n")
+
+    def serve(self):
+        asyncio.run(self.run())
+
+# Remove the socket 'path' left by a daemon that is not running anymore.
+# OSError is raised when a daemon is still listening on it
+def _remove_stale_socket(path):
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+    raise OSError('A daemon is already listening on %s' % path)
+
+if __name__ == '__main__':
+
+    argparser = argparse.ArgumentParser(
+        description='Serve the translations of OpenACC pragmas to OpenMP on '
+                    'a Unix domain socket, see client.py')
+    argparser.add_argument('--socket',
+        help='path of the socket (default: $%s or %s)'
+             % (client.SOCKET_VARIABLE, client.default_socket()))
+    argparser.add_argument('-j', '--jobs', type=int,
+        help='number of processes translating (default: number of CPUs)')
+    argparser.add_argument('--cache-dir',
+        help='reuse the translations stored in this directory and store the '
+             'new ones')
+    argparser.add_argument('--cache-size', type=float, default=1024,
+        help='size limit of the cache directory in MB (default: 1024)')
+    argparser.add_argument('--target', choices=emitter.TARGETS,
+        default=emitter.target,
+        help='target of the requests that do not give one (default: %s)'
+             % emitter.target)
+    args = argparser.parse_args()
+
+    cache = None
+    if args.cache_dir is not None:
+        import cache as translation_cache
+        cache = translation_cache.TranslationCache(
+            args.cache_dir, int(args.cache_size * 1e6))
+
+    try:
+        TranslationDaemon(args.socket, args.jobs, cache,
+                          target=args.target).serve()
+    except OSError as e:
+        sys.exit(str(e))
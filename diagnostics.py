@@ -0,0 +1,62 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Diagnostics of the pragmas that could not be translated
+# -----------------------------------------------------------------------------
+
+import json
+
+# A pragma left untranslated: the file and the line where it starts, its
+# text and the message of the error
+class Diagnostic(object):
+    __slots__ = ('file', 'line', 'pragma', 'message')
+
+    def __init__(self, file, line, pragma, message):
+        self.file = file
+        self.line = line
+        self.pragma = pragma
+        self.message = message
+
+    # Return: Dictionary with the fields of the diagnostic
+    def as_dict(self):
+        return {'file': self.file, 'line': self.line, 'pragma': self.pragma,
+                'error': self.message}
+
+    def __str__(self):
+        return "%s:%d: warning: %s, pragma left untranslated" % (
+            self.file or '<input>', self.line, self.message)
+
+# Diagnostics of the translations of the file 'file'. A translation given a
+# Diagnostics copies the pragmas it cannot translate to the output as they
+# are and records them here instead of stopping
+class Diagnostics(object):
+
+    def __init__(self, file=None):
+        self.file = file
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    # Record the pragma 'pragma' starting at line 'line' that could not be
+    # translated because of 'message'
+    def add(self, line, pragma, message):
+        self.entries.append(Diagnostic(self.file, line, pragma, message))
+
+    # Add the diagnostics of the Diagnostics 'other'
+    def merge(self, other):
+        self.entries.extend(other.entries)
+
+    # Write the diagnostics to the file object 'output', one per line
+    def report(self, output):
+        for entry in self.entries:
+            output.write("%s\n" % entry)
+
+    # Write the diagnostics to the file object 'output', one JSON object per
+    # line
+    def write_json(self, output):
+        for entry in self.entries:
+            output.write(json.dumps(entry.as_dict()) + "\n")
@@ -0,0 +1,249 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Emitter of the OpenMP text of the pragmas built by the grammar
+# -----------------------------------------------------------------------------
+
+from ir import Pragma
+
+# OpenMP map type of each OpenACC data clause, in the order the maps are
+# written
+DATA_MAPS = [('copy', 'tofrom'), ('copyin', 'to'), ('copyout', 'from'),
+             ('create', 'alloc')]
+
+# OpenMP map type of each data clause of the enter data and exit data
+# directives. As in OpenACC, deleting the data only releases the reference of
+# the enter data, the data stays on the device while a region still maps it
+ENTER_MAPS = [('copyin', 'to'), ('create', 'alloc')]
+EXIT_MAPS = [('copyout', 'from'), ('delete', 'release')]
+
+# OpenMP motion clause of each clause of the update directive
+UPDATE_MOTIONS = [('host', 'from'), ('device', 'to')]
+
+# Targets of the translations: 'host' runs the compute constructs on the
+# threads of the host, 'device' offloads them to the teams of a device
+TARGETS = ('host', 'device')
+
+# Target of the translations, set with set_target
+target = 'host'
+
+# Set the target the compute constructs are translated for, one of TARGETS.
+# The pragmas kept in memory do not depend on it, only their text does
+def set_target(name):
+    global target
+    if name not in TARGETS:
+        raise ValueError("unknown target '%s', expected one of %s"
+                         % (name, ", ".join(TARGETS)))
+    target = name
+
+# OpenMP words of each OpenACC level of parallelism, from the outermost, for
+# each target. On a device the gangs are its teams, the workers the threads
+# of a team and the vector the simd lanes of a thread. The host has a single
+# level of threads: the gangs are its threads and each worker runs the
+# iterations of its gang
+LEVELS = {
+    'device': [('gang', ['distribute']), ('worker', ['parallel', 'for']),
+               ('vector', ['simd'])],
+    'host': [('gang', ['for']), ('worker', []), ('vector', ['simd'])],
+}
+
+# Levels of a loop that does not name any, left to the translator as the
+# auto clause does
+AUTO_LEVELS = ('gang', 'worker')
+
+# Return: List of strings, each string is the OpenMP clause of a clause of
+# 'directive' that is not about data and that the OpenMP construct made of
+# the list of words 'words' accepts
+def _clauses(directive, words):
+    parts = []
+    for clause in directive.clauses:
+        name = clause.name
+        if name in ('num_workers', 'worker') and clause.value is not None:
+            if 'parallel' in words:
+                parts.append('num_threads(' + clause.value + ')')
+            elif 'teams' in words:
+                parts.append('thread_limit(' + clause.value + ')')
+        elif name == 'vector' and clause.value is not None:
+            if 'simd' in words:
+                parts.append('simdlen(' + clause.value + ')')
+        elif name == 'collapse':
+            if 'for' in words or 'distribute' in words or 'simd' in words:
+                parts.append('collapse(' + clause.value + ')')
+        elif name == 'reduction':
+            if words[-1] != 'data':
+                parts.append('reduction(' + clause.operator + ':' +
+                             ", ".join(clause.variables) + ')')
+    return parts
+
+# Return: List of strings, each string is the OpenMP clause of a kind of
+# clause of 'directive', written with the format 'pattern' from the OpenMP
+# kind and the variables. 'kinds' is the list of tuples of the OpenACC clause
+# and of its OpenMP kind. The variables of every clause of the same kind go
+# in the same OpenMP clause
+def _variable_clauses(directive, kinds, pattern):
+    parts = []
+    for name, kind in kinds:
+        variables = [str(var) for clause in directive.clauses
+                     if clause.name == name for var in clause.variables]
+        if variables:
+            parts.append(pattern % (kind, ", ".join(variables)))
+    return parts
+
+# Return: List of strings, each string is the map clause of a kind of data
+# clause of 'directive', with the map types of 'maps'
+def _maps(directive, maps=DATA_MAPS):
+    return _variable_clauses(directive, maps, 'map(%s:%s)')
+
+# Return: List of strings representing the OpenMP construct made of the list
+# of words 'words', with the clauses of 'directive' it accepts and 'maps'
+def _construct(words, directive, maps=()):
+    return [" ".join(words)] + _clauses(directive, words) + list(maps)
+
+# Return: List of the levels of parallelism sharing the loop of 'directive',
+# found in the nesting 'outer'. A loop only takes the levels below the ones
+# of its enclosing loops. A loop that names no level is shared over
+# AUTO_LEVELS, or over the level below the ones of its enclosing loops, and
+# the loop of a compute construct is always shared over the gangs
+def _loop_levels(directive, outer=None, compute=False):
+    names = [name for name, words in LEVELS[target]]
+    taken = outer[1] if outer is not None else ()
+    free = names[max([names.index(name) + 1 for name in taken] or [0]):]
+    if not any(directive.has(name) for name in names):
+        return list(AUTO_LEVELS) if not taken else free[:1]
+    levels = [name for name in free if directive.has(name)]
+    if compute and 'gang' not in levels:
+        levels.insert(0, 'gang')
+    return levels
+
+# Return: List of the OpenMP words sharing the loop of 'directive' over its
+# levels of parallelism on the target, in the order of a combined construct
+def _loop_words(directive, outer=None, compute=False):
+    levels = _loop_levels(directive, outer, compute)
+    return [word for name, words in LEVELS[target] if name in levels
+            for word in words]
+
+# Return: Nesting of the statement that follows 'directive' when the
+# directive is found in the nesting 'outer'. The nesting is None outside of
+# the compute constructs, otherwise a tuple of the compute construct around
+# the statement, 'parallel' or 'kernels', and of the levels of parallelism
+# its enclosing loops share. 'loops' tells that the statement of a kernels
+# region only runs loops: on a device the construct is then 'loops' and each
+# of its loops is offloaded as a kernels loop construct
+def nesting(directive, outer, loops=False):
+    construct = directive.construct
+    if construct == 'kernels' and loops and target == 'device':
+        return ('loops', ())
+    if construct in ('parallel', 'kernels'):
+        return (construct, ())
+    if construct in ('parallel loop', 'kernels loop') or \
+            (construct == 'loop' and outer is not None and
+             outer[0] == 'loops'):
+        return (construct.split()[0] if construct != 'loop' else 'kernels',
+                tuple(_loop_levels(directive, compute=True)))
+    if construct == 'loop' and outer is not None:
+        return (outer[0], outer[1] + tuple(_loop_levels(directive, outer)))
+    return outer
+
+# Return: List of lists. Each list represents an OpenMP construct and is a
+# list of strings. The data of 'directive' is mapped around 'constructs'
+def _mapped(directive, constructs):
+    maps = _maps(directive)
+    if maps:
+        constructs.insert(0, ['target data'] + maps)
+    return constructs
+
+# A device runs the loop in a single combined construct mapping its data,
+# the host with its threads
+def _compute_loop(directive, outer, inner):
+    words = _loop_words(directive, compute=True)
+    if target == 'device':
+        return [_construct(['target', 'teams'] + words, directive,
+                           _maps(directive))]
+    return _mapped(directive, [_construct(['parallel'] + words, directive)])
+
+# A device runs the region on its teams, which share the gang loops of the
+# region. The threads of the host run a parallel region redundantly, as the
+# gangs of OpenACC do
+def _parallel_region(directive, outer, inner):
+    if target == 'device':
+        return [_construct(['target', 'teams'], directive, _maps(directive))]
+    return _mapped(directive, [_construct(['parallel'], directive)])
+
+# The gangs of a kernels region do not run its code redundantly, so a device
+# runs a region with code outside of its loops on a single team, whose
+# threads share the loops of the region. A region that only runs loops, as
+# 'inner' tells, and the regions of the host only map their data and their
+# loops start their own threads. A region without data then gives no line
+def _kernels_region(directive, outer, inner):
+    if target == 'device' and (inner is None or inner[0] != 'loops'):
+        return [_construct(['target', 'teams'], directive,
+                           ['num_teams(1)'] + _maps(directive))]
+    return _mapped(directive, [])
+
+# A loop running on a single level of the host, as a worker loop does, gives
+# no line. 'outer' is the nesting of the loop. The host runs a kernels region
+# without threads, so its outermost gang loops start their own. Only
+# distribute and parallel constructs may be nested right inside the teams of
+# a device, so a vector loop outside of any gang or worker loop starts the
+# threads of each team, which keeps the code of the gangs redundant
+def _loop(directive, outer, inner):
+    if outer is not None and outer[0] == 'loops':
+        return _compute_loop(directive, outer, inner)
+    words = _loop_words(directive, outer)
+    if not words:
+        return []
+    if outer is not None and not outer[1]:
+        if target == 'host' and outer[0] == 'kernels' and words[0] == 'for':
+            words = ['parallel'] + words
+        elif target == 'device' and words[0] == 'simd':
+            words = ['parallel', 'for'] + words
+    return [_construct(words, directive)]
+
+def _data(directive, outer, inner):
+    return [_construct(['target', 'data'], directive, _maps(directive))]
+
+# The directives that only move data give no line when they have no data
+def _enter_data(directive, outer, inner):
+    maps = _maps(directive, ENTER_MAPS)
+    return [['target enter data'] + maps] if maps else []
+
+def _exit_data(directive, outer, inner):
+    maps = _maps(directive, EXIT_MAPS)
+    return [['target exit data'] + maps] if maps else []
+
+def _update(directive, outer, inner):
+    motions = _variable_clauses(directive, UPDATE_MOTIONS, '%s(%s)')
+    return [['target update'] + motions] if motions else []
+
+# Function giving the OpenMP constructs of each OpenACC construct, from its
+# Directive, its nesting and the nesting of the statement that follows it
+CONSTRUCTS = {
+    'parallel loop': _compute_loop,
+    'parallel': _parallel_region,
+    'kernels loop': _compute_loop,
+    'kernels': _kernels_region,
+    'loop': _loop,
+    'data': _data,
+    'enter data': _enter_data,
+    'exit data': _exit_data,
+    'update': _update,
+}
+
+# Return: String with the OpenMP lines of the Pragma 'pragma', found in the
+# nesting 'outer' as given by nesting. 'inner' is the nesting of the
+# statement that follows it, when it is known
+def emit_pragma(pragma, outer=None, inner=None):
+    spaces = ' ' * pragma.indent
+    construct = pragma.directive.construct
+    if construct not in CONSTRUCTS:
+        return spaces + '#pragma ' + construct + ' \n'
+    return "".join([spaces + '#pragma omp ' + " ".join(parts) + ' \n'
+                    for parts in CONSTRUCTS[construct](pragma.directive,
+                                                       outer, inner)])
+
+# Return: String with the text of 'items', a list of Pragma and of strings
+# holding the lines copied verbatim, found in the nesting 'outer'. 'inner' is
+# the nesting of the statement that follows the pragma, when it is known
+def emit(items, outer=None, inner=None):
+    return "".join([emit_pragma(item, outer, inner)
+                    if isinstance(item, Pragma) else item for item in items])
@@ -0,0 +1,78 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Intermediate representation of the pragmas built by the grammar. The
+# objects are shared by every occurrence of a pragma kept in memory, so they
+# are never modified once built
+# -----------------------------------------------------------------------------
+
+# A pragma line: 'indent' is the number of white spaces before the '#' and
+# 'directive' is its Directive
+class Pragma(object):
+    __slots__ = ('indent', 'directive')
+
+    def __init__(self, indent, directive):
+        self.indent = indent
+        self.directive = directive
+
+    def __repr__(self):
+        return 'Pragma(%d, %r)' % (self.indent, self.directive)
+
+# A directive: 'construct' is the OpenACC construct ('parallel loop',
+# 'parallel', 'kernels loop', 'kernels', 'loop', 'data', 'enter data', 'exit
+# data' or 'update') or the 'scop' and 'endscop' markers, and 'clauses' is
+# the list of its Clause in the order they were written
+class Directive(object):
+    __slots__ = ('construct', 'clauses')
+
+    def __init__(self, construct, clauses=()):
+        self.construct = construct
+        self.clauses = list(clauses)
+
+    # Return: True when the directive has a clause called 'name'
+    def has(self, name):
+        for clause in self.clauses:
+            if clause.name == name:
+                return True
+        return False
+
+    # Return: List of the clauses called 'name', in the order they were written
+    def named(self, name):
+        return [clause for clause in self.clauses if clause.name == name]
+
+    def __repr__(self):
+        return 'Directive(%r, %r)' % (self.construct, self.clauses)
+
+# A clause: 'name' is the OpenACC clause name. 'value' is the string of the
+# integer argument of num_workers, worker, vector and collapse, 'operator' is
+# the reduction operator and 'variables' is the list of names of a reduction
+# or the list of DataVar of a data clause or of a host or device clause
+class Clause(object):
+    __slots__ = ('name', 'value', 'operator', 'variables')
+
+    def __init__(self, name, value=None, operator=None, variables=()):
+        self.name = name
+        self.value = value
+        self.operator = operator
+        self.variables = list(variables)
+
+    def __repr__(self):
+        return 'Clause(%r, %r, %r, %r)' % (self.name, self.value,
+                                           self.operator, self.variables)
+
+# A variable of a data clause: 'name' is the variable and 'sections' is the
+# list of strings between the brackets of a subarray, empty for a whole
+# variable
+class DataVar(object):
+    __slots__ = ('name', 'sections')
+
+    def __init__(self, name, sections=()):
+        self.name = name
+        self.sections = list(sections)
+
+    def __str__(self):
+        return self.name + ''.join(['[' + section + ']'
+                                    for section in self.sections])
+
+    def __repr__(self):
+        return 'DataVar(%r, %r)' % (self.name, self.sections)
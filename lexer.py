@@ -26,7 +26,14 @@ reserved = {
         'copyout'     : 'COPYOUT',
         'create'      : 'CREATE',
         'gang'        : 'GANG',
-        'data'        : 'DATA'
+        'worker'      : 'WORKER',
+        'data'        : 'DATA',
+        'enter'       : 'ENTER',
+        'exit'        : 'EXIT',
+        'update'      : 'UPDATE',
+        'delete'      : 'DELETE',
+        'host'        : 'HOST',
+        'device'      : 'DEVICE'
 }
 tokens = [
 # Shoudn`t be on anything rules
@@ -104,8 +111,10 @@ def t_BACKSLASH(t):
     else:
         return t
 
+# A run of white spaces gives a single token, the new lines are left to
+# t_NEWLINE
 def t_SPACE(t):
-    r'\s'
+    r'[^\S\n]+'
     # Output the SPACE token only if lexer not in a pragma
     if t.lexer.in_pragma == 0:
         return t
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ACC', 'AND', 'BACKSLASH', 'BITWISE_AND', 'BITWISE_OR', 'BPRAGMA', 'COLLAPSE', 'COLON', 'COMMA', 'COPY', 'COPYIN', 'COPYOUT', 'CREATE', 'DATA', 'DELETE', 'DEVICE', 'ENDSCOP', 'ENTER', 'EPRAGMA', 'EXIT', 'GANG', 'HOST', 'ID', 'INDEPENDENT', 'INT', 'KERNELS', 'LBRACKET', 'LOOP', 'LPAREN', 'MAX', 'MIN', 'MODULE', 'MUL', 'NEWLINE', 'NUM_WORKERS', 'OR', 'OTHER', 'PARALLEL', 'RBRACKET', 'REDUCTION', 'RPAREN', 'SCOP', 'SPACE', 'SUM', 'TAB', 'UPDATE', 'VECTOR', 'WORKER'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_INT>[0-9]+)|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_BPRAGMA>\\#[ ]*pragma)|(?P<t_NEWLINE>\\n)|(?P<t_BACKSLASH>\\\\)|(?P<t_SPACE>[^\\S\\n]+)|(?P<t_TAB>\\t)|(?P<t_SUM>\\+)|(?P<t_MUL>\\*)|(?P<t_MAX>max)|(?P<t_MIN>min)|(?P<t_AND>&&)|(?P<t_OR>\\|\\|)|(?P<t_BITWISE_AND>&)|(?P<t_BITWISE_OR>\\|)|(?P<t_MODULE>%)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_OTHER>\\S+)', [None, ('t_INT', 'INT'), ('t_ID', 'ID'), ('t_BPRAGMA', 'BPRAGMA'), ('t_NEWLINE', 'NEWLINE'), ('t_BACKSLASH', 'BACKSLASH'), ('t_SPACE', 'SPACE'), ('t_TAB', 'TAB'), ('t_SUM', 'SUM'), ('t_MUL', 'MUL'), ('t_MAX', 'MAX'), ('t_MIN', 'MIN'), ('t_AND', 'AND'), ('t_OR', 'OR'), ('t_BITWISE_AND', 'BITWISE_AND'), ('t_BITWISE_OR', 'BITWISE_OR'), ('t_MODULE', 'MODULE'), ('t_LPAREN', 'LPAREN'), ('t_RPAREN', 'RPAREN'), ('t_LBRACKET', 'LBRACKET'), ('t_RBRACKET', 'RBRACKET'), ('t_COLON', 'COLON'), ('t_COMMA', 'COMMA'), ('t_OTHER', 'OTHER')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
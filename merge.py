@@ -0,0 +1,365 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Data regions: merging of adjacent regions into one, so the data they share
+# is transferred once, and mapping of the data that an enclosing region
+# already holds on the device
+# -----------------------------------------------------------------------------
+
+import re
+
+from ir import Pragma, Directive, Clause
+
+# Constructs whose statement runs on the device
+COMPUTE = ('parallel loop', 'parallel', 'kernels loop', 'kernels')
+
+# Constructs whose data clauses map their data around a statement, the ones
+# that can be merged
+REGIONS = COMPUTE + ('data',)
+
+# Constructs whose data stays on the device for the whole statement that
+# follows, so the constructs inside it find the data there
+BLOCKS = ('parallel', 'kernels', 'data')
+
+# Data clauses that copy the data to or from the device
+_COPY_CLAUSES = ('copy', 'copyin', 'copyout')
+
+# Data clause of a merged variable, by whether it is copied to the device
+# when the region starts and copied back when it ends
+_MERGED_CLAUSES = {(True, True): 'copy', (True, False): 'copyin',
+                   (False, True): 'copyout', (False, False): 'create'}
+
+# Matches the characters that _scan_to looks at
+_special = re.compile(r'["\'/#()\[\]{};]')
+
+# Statements that are followed by a parenthesized expression and a statement
+_HEADED = ('for', 'while', 'switch')
+
+# Return: Position of the first character of 'text' from 'pos' that is not a
+# white space or in a comment, 'limit' at most. The text from 'limit' is not
+# looked at, it is the end of 'text' by default
+def skip_blank(text, pos, limit=None):
+    if limit is None:
+        limit = len(text)
+    while pos < limit:
+        if text[pos].isspace():
+            pos += 1
+        elif text.startswith('//', pos, limit):
+            end = text.find('\n', pos, limit)
+            pos = limit if end < 0 else end + 1
+        elif text.startswith('/*', pos, limit):
+            end = text.find('*/', pos + 2, limit)
+            pos = limit if end < 0 else end + 2
+        else:
+            break
+    return pos
+
+# Return: Position just after the string or character literal starting at
+# 'pos', -1 when it does not end before 'limit'
+def _literal_end(text, pos, limit):
+    quote = text[pos]
+    pos += 1
+    while pos < limit:
+        if text[pos] == '\\':
+            pos += 2
+        elif text[pos] == quote:
+            return pos + 1
+        elif text[pos] == '\n':
+            return -1
+        else:
+            pos += 1
+    return -1
+
+# Return: Position just after the pragma whose '#' is at 'pos', following
+# the backslash continuations, -1 when it is another preprocessor line or
+# does not end before 'limit'
+def _pragma_line_end(text, pos, limit):
+    if not text.startswith('pragma', skip_blank(text, pos + 1, limit), limit):
+        return -1
+    while True:
+        end = text.find('\n', pos, limit)
+        if end < 0:
+            return -1
+        if not text[pos:end].rstrip().endswith('\\'):
+            return end + 1
+        pos = end + 1
+
+# Return: Position just after the text from 'pos' that ends with the first
+# character of 'stops' out of brackets, literals and comments, -1 when there
+# is none before 'limit'. A preprocessor line or a closing bracket without
+# its opening one also gives -1
+def _scan_to(text, pos, stops, limit):
+    depth = 0
+    while True:
+        match = _special.search(text, pos, limit)
+        if match is None:
+            return -1
+        pos = match.start()
+        c = text[pos]
+        if c in '"\'':
+            pos = _literal_end(text, pos, limit)
+            if pos < 0:
+                return -1
+            continue
+        if c == '/' and text.startswith(('//', '/*'), pos, limit):
+            pos = skip_blank(text, pos, limit)
+            continue
+        if c == '#' and text[text.rfind('\n', 0, pos) + 1:pos].strip() == '':
+            pos = _pragma_line_end(text, pos, limit)
+            if pos < 0:
+                return -1
+            continue
+        if c in stops and depth == 0:
+            return pos + 1
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+            if depth < 0:
+                return -1
+        pos += 1
+
+# Return: String of the identifier starting at 'pos', empty when there is
+# none
+def _word(text, pos, limit):
+    end = pos
+    while end < limit and (text[end].isalnum() or text[end] == '_'):
+        end += 1
+    return text[pos:end]
+
+# Return: Position just after the C statement starting at or after 'pos',
+# -1 when it does not end in 'text' or cannot be followed safely. The
+# pragmas inside a compound statement are part of it. The text from 'limit'
+# is not looked at and a statement that may go on past it gives -1, so a
+# larger 'limit' gives the same end or finds one that a smaller one does not
+def statement_end(text, pos, limit=None):
+    if limit is None or limit > len(text):
+        limit = len(text)
+    pos = skip_blank(text, pos, limit)
+    if pos >= limit:
+        return -1
+    if text[pos] == '{':
+        return _scan_to(text, pos + 1, '}', limit)
+    # A pragma of the statement, a nested loop for instance
+    if text[pos] == '#':
+        pos = _pragma_line_end(text, pos, limit)
+        return -1 if pos < 0 else statement_end(text, pos, limit)
+    word = _word(text, pos, limit)
+    if word in _HEADED or word == 'if':
+        pos = skip_blank(text, pos + len(word), limit)
+        if not text.startswith('(', pos, limit):
+            return -1
+        pos = _scan_to(text, pos + 1, ')', limit)
+        if pos < 0:
+            return -1
+        end = statement_end(text, pos, limit)
+        if word != 'if' or end < 0:
+            return end
+        after = skip_blank(text, end, limit)
+        word = _word(text, after, limit)
+        # An 'else' may follow past 'limit'
+        if after + len(word) >= limit:
+            return -1
+        if word != 'else':
+            return end
+        return statement_end(text, after + len('else'), limit)
+    if word == 'do':
+        pos = statement_end(text, pos + len(word), limit)
+        if pos < 0:
+            return -1
+        pos = skip_blank(text, pos, limit)
+        if _word(text, pos, limit) != 'while':
+            return -1
+        return _scan_to(text, pos + len('while'), ';', limit)
+    return _scan_to(text, pos, ';', limit)
+
+# Return: Dictionary with, for each variable of the data clauses of
+# 'directive' in the order they are written, the tuple of its DataVar and of
+# whether it is copied in and copied out by the region
+def _transfers(directive):
+    variables = {}
+    for clause in directive.clauses:
+        if clause.name in ('copy', 'copyin', 'copyout', 'create'):
+            for variable in clause.variables:
+                unused, copy_in, copy_out = variables.get(
+                    variable.name, (None, False, False))
+                variables[variable.name] = (
+                    variable, copy_in or clause.name in ('copy', 'copyin'),
+                    copy_out or clause.name in ('copy', 'copyout'))
+    return variables
+
+# Return: Dictionary with, for each variable of the list of Directive
+# 'directives' run one after the other, the tuple of its DataVar, of whether
+# the merged region copies it in and copies it out and of the number of
+# transfers of the separate regions. None when they cannot share the data of
+# a variable: it must be mapped with the same sections everywhere and be
+# copied in again only after a region that copied it out, as the data of the
+# device may differ from the one of the host after any other region
+def _merged_transfers(directives):
+    merged = {}
+    # Variable -> whether the device holds the data of the host
+    same = {}
+    for directive in directives:
+        for name, (variable, copy_in, copy_out) in \
+                _transfers(directive).items():
+            if name not in merged:
+                merged[name] = (variable, copy_in, copy_out, 0)
+                same[name] = True
+            first, merged_in, merged_out, count = merged[name]
+            if str(first) != str(variable) or (copy_in and not same[name]):
+                return None
+            # The data copied out would hold what a created one writes
+            if merged_out and not copy_in and not copy_out:
+                return None
+            merged[name] = (first, merged_in, merged_out or copy_out,
+                            count + copy_in + copy_out)
+            same[name] = copy_out
+    return merged
+
+# Return: True when the Directive 'directive' can follow the list of
+# Directive 'directives' in a merged region
+def compatible(directives, directive):
+    return (directive.construct in REGIONS and
+            _merged_transfers(directives + [directive]) is not None)
+
+# Return: True when the statement starting at 'pos' may be the body of a
+# control statement, a loop without braces for instance, so it cannot be
+# wrapped with the statements that follow it. When nothing but white spaces
+# comes before 'pos', 'at_start' tells if 'text' is the beginning of the
+# file
+def may_be_body(text, pos, at_start):
+    while pos > 0 and text[pos - 1].isspace():
+        pos -= 1
+    if pos == 0:
+        return not at_start
+    if text[pos - 1] == ')':
+        return True
+    end = pos
+    while pos > 0 and (text[pos - 1].isalnum() or text[pos - 1] == '_'):
+        pos -= 1
+    return text[pos:end] in ('else', 'do')
+
+# Return: Tuple with the Directive of the data region mapping the variables
+# of the list of compatible Directive 'directives', run one after the other,
+# and the list of the tuples of the DataVar and of the number of transfers
+# saved for each variable
+def merged_region(directives):
+    clauses = {}
+    saved = []
+    for variable, copy_in, copy_out, count in \
+            _merged_transfers(directives).values():
+        kind = _MERGED_CLAUSES[copy_in, copy_out]
+        clauses.setdefault(kind, []).append(variable)
+        saved.append((variable, count - copy_in - copy_out))
+    directive = Directive('data', [Clause(kind, variables=clauses[kind])
+                                   for kind in ('copy', 'copyin', 'copyout',
+                                                'create')
+                                   if kind in clauses])
+    return directive, saved
+
+# Return: Frozenset of the names of the variables of the data clauses of
+# 'directive'
+def data_names(directive):
+    return frozenset(variable.name for clause in directive.clauses
+                     if clause.name in _COPY_CLAUSES + ('create',)
+                     for variable in clause.variables)
+
+# Return: Pragma 'pragma' where the variables of the data clauses whose names
+# are in the set 'present' are only created. An enclosing region holds their
+# data on the device, so as with the present-or semantics of OpenACC they are
+# neither copied in nor copied out. 'pragma' itself is returned when no
+# variable is present or when it is not the pragma of a region, the pragmas
+# are shared and never modified
+def present_pragma(pragma, present):
+    if pragma.directive.construct not in REGIONS:
+        return pragma
+    clauses = []
+    created = []
+    for clause in pragma.directive.clauses:
+        if clause.name in _COPY_CLAUSES and \
+                any(variable.name in present for variable in clause.variables):
+            created += [variable for variable in clause.variables
+                        if variable.name in present]
+            variables = [variable for variable in clause.variables
+                         if variable.name not in present]
+            if variables:
+                clauses.append(Clause(clause.name, variables=variables))
+        else:
+            clauses.append(clause)
+    if not created:
+        return pragma
+    clauses.append(Clause('create', variables=created))
+    return Pragma(pragma.indent,
+                  Directive(pragma.directive.construct, clauses))
+
+# Return: String with the C expression of the size in bytes of the DataVar
+# 'variable'. A section 'start:length' counts 'length' elements and a
+# section without ':' a single one
+def size_expression(variable):
+    if not variable.sections:
+        return 'sizeof(' + variable.name + ')'
+    lengths = []
+    for section in variable.sections:
+        if ':' in section:
+            length = section.split(':', 1)[1].strip()
+            lengths.append('(' + length + ')' if length else
+                           'sizeof(' + variable.name + ')')
+    element = variable.name + '[0]' * len(variable.sections)
+    return '*'.join(lengths + ['sizeof(' + element + ')'])
+
+# A data region made of adjacent regions: the file and the line of the first
+# one, the number of regions merged and the list of tuples of the DataVar
+# and of the number of transfers saved
+class DataMerge(object):
+    __slots__ = ('file', 'line', 'regions', 'saved')
+
+    def __init__(self, file, line, regions, saved):
+        self.file = file
+        self.line = line
+        self.regions = regions
+        self.saved = saved
+
+    # Return: Number of transfers the merge saves
+    def transfers(self):
+        return sum(count for variable, count in self.saved)
+
+    def __str__(self):
+        sizes = ["%d x %s (%s bytes)" % (count, variable,
+                                         size_expression(variable))
+                 for variable, count in self.saved if count]
+        return "%s:%d: note: %d data regions merged, %d transfers saved%s" % (
+            self.file or '<input>', self.line, self.regions, self.transfers(),
+            ": " + ", ".join(sizes) if sizes else "")
+
+# Data regions merged by the translations of the file 'file'. A translation
+# given a DataMerges wraps the runs of adjacent regions that share data in
+# a single data region and records them here
+class DataMerges(object):
+
+    def __init__(self, file=None):
+        self.file = file
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    # Record the merge of 'regions' regions starting at line 'line', saving
+    # the transfers of the list 'saved'
+    def add(self, line, regions, saved):
+        self.entries.append(DataMerge(self.file, line, regions, saved))
+
+    # Return: Number of transfers saved by every merge
+    def transfers(self):
+        return sum(entry.transfers() for entry in self.entries)
+
+    # Write the merges and their total to the file object 'output', one per
+    # line
+    def report(self, output):
+        for entry in self.entries:
+            output.write("%s\n" % entry)
+        output.write("%d data regions merged into %d, %d transfers saved\n"
+                     % (sum(entry.regions for entry in self.entries),
+                        len(self.entries), self.transfers()))
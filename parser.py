@@ -13,6 +13,19 @@ from lexer import tokens
 
 import sys
 import os
+import re
+import mmap
+import argparse
+import functools
+import contextlib
+
+from stats import TranslationStats
+from diagnostics import Diagnostics
+from merge import DataMerges
+from sink import OutputSink, FileSink, StreamSink, BufferSink
+from ir import Pragma, Directive, Clause, DataVar
+import emitter
+import merge
 
 # Parsing rules
 
@@ -21,10 +34,10 @@ precedence = (
     ('nonassoc','LOOP'),
     )
 
+# Return: List of Pragma and of strings, the text is given by emitter.emit
 def p_program(t):
     '''program : lines'''
     t[0] = t[1]
-    t[0] =  "".join(t[0])
 
 #def p_structured_block_list(t):
 #    '''structured_block_list : structured_block structured_block_list
@@ -34,65 +47,83 @@ def p_program(t):
 #    else:
 #        t[0] = []
 
-# Return: List of string, each string is a line
+# Return: List of Pragma and of strings, each string is a line
 def p_lines_praga(t):
-    '''lines : pragma lines'''
-    t[0] = [" ".join(t[1]).replace("  ", " ").replace("\n ", "\n")] + t[2]
+    '''lines : lines pragma'''
+    t[1].append(t[2])
+    t[0] = t[1]
 
-# Return: List of string, each string is a line
+# Return: List of Pragma and of strings, each string is a line
 def p_lines_ignored_line(t):
-    '''lines : ignored_line lines
+    '''lines : lines ignored_line
              | '''
     if len(t) == 3:
-        t[0] = ["".join(t[1])] + t[2]
+        t[1].append("".join(t[2]))
+        t[0] = t[1]
     else:
         t[0] = []
 
+# The leading white spaces are shared with the pragma productions, so a line
+# is only known to be ignored once its first non white space token is seen
 def p_ignored_line(t):
-    'ignored_line : anything NEWLINE'
-    t[0] = t[1] + ['\n']
+    '''ignored_line : spaces NEWLINE
+                    | spaces solid anything NEWLINE'''
+    t[0] = t[1]
+    if len(t) == 5:
+        t[0].append(t[2])
+        t[0] += t[3]
+    t[0].append('\n')
 
 def p_anything(t):
-    '''anything : OTHER anything
-                | INT anything
-                | word anything
-                | other_mark anything
-                | whitespace anything
-                | operator anything
-                | ponctuation anything
+    '''anything : anything OTHER
+                | anything INT
+                | anything word
+                | anything other_mark
+                | anything whitespace
+                | anything operator
+                | anything ponctuation
                 | '''
     if len(t) == 3:
-        t[0] = [t[1]] + t[2]
+        t[1].append(t[2])
+        t[0] = t[1]
     else:
         t[0] = []
 
+# Return: Pragma with the number of white spaces before it and its Directive
 def p_pragma(t):
     'pragma : spaces BPRAGMA ACC construct EPRAGMA'
-    t[0] = []
-    for construct in t[4]:
-        t[0] += t[1] + ['#pragma omp'] + construct + ['\n']
-    #print("Pragma 1")
+    t[0] = Pragma(len("".join(t[1])), t[4])
 
 def p_pragma_scop(t):
     'pragma : spaces BPRAGMA SCOP EPRAGMA'
-    t[0] = t[1] + ['#pragma scop'] + ['\n']
-    #print("Pragma 2")
+    t[0] = Pragma(len("".join(t[1])), Directive('scop'))
 
 def p_pragma_endscop(t):
     'pragma : spaces BPRAGMA ENDSCOP EPRAGMA'
-    t[0] = t[1] + ['#pragma endscop'] + ['\n']
-    #print("Pragma 3")
+    t[0] = Pragma(len("".join(t[1])), Directive('endscop'))
 
 ######################## BEGIN AUXILIARIES PRODUCTIONS ########################
 
+# Return: List of the runs of white spaces, as found in the input
 def p_spaces(t):
-    '''spaces : whitespace spaces
+    '''spaces : spaces whitespace
               | '''
     if len(t) == 3:
-        t[0] = [' '] + t[2]
+        t[1].append(t[2])
+        t[0] = t[1]
     else:
         t[0] = []
 
+# Return: String of the first token of a line that is not a white space
+def p_solid(t):
+    '''solid : OTHER
+             | INT
+             | word
+             | other_mark
+             | operator
+             | ponctuation'''
+    t[0] = t[1]
+
 def p_whitespace(t):
     '''whitespace : SPACE
                   | TAB'''
@@ -116,7 +147,14 @@ def p_word(t):
             | COPYOUT 
             | CREATE 
             | GANG 
+            | WORKER 
             | DATA 
+            | ENTER 
+            | EXIT 
+            | UPDATE 
+            | DELETE 
+            | HOST 
+            | DEVICE 
             | ID'''
     if len(t) == 2:
         t[0] = t[1]
@@ -150,15 +188,16 @@ def p_other_mark(t):
         t[0] = t[1]
 
 def p_between_other_mark(t):
-    '''between_other_marks : OTHER between_other_marks
-                           | INT between_other_marks
-                           | word between_other_marks
-                           | whitespace between_other_marks
-                           | operator between_other_marks
-                           | ponctuation between_other_marks
+    '''between_other_marks : between_other_marks OTHER
+                           | between_other_marks INT
+                           | between_other_marks word
+                           | between_other_marks whitespace
+                           | between_other_marks operator
+                           | between_other_marks ponctuation
                            | '''
     if len(t) == 3:
-        t[0] = [t[1]] + t[2]
+        t[1].append(t[2])
+        t[0] = t[1]
     if len(t) == 1:
         t[0] = []
 
@@ -188,21 +227,25 @@ def p_varname(t):
                 | COPYOUT
                 | CREATE
                 | GANG
-                | DATA'''
+                | WORKER
+                | DATA
+                | ENTER
+                | EXIT
+                | UPDATE
+                | DELETE
+                | HOST
+                | DEVICE'''
     t[0] = t[1]
 
-# Return: Tuple, first element is a list of strings, each string is a clause and
-# second element is a dictionarie with where the key 'clause_name' get the 
-# clause parameter
+# Return: List of Clause, in the order they were written
 def p_clause_list(t):
     '''clause_list : clause
                    | clause_list possible_comma clause'''
     if len(t) == 2:
-        t[0] = t[1]
+        t[0] = [t[1]]
     if len(t) == 4:
-        new_dict = t[1][1].copy()
-        new_dict.update(t[3][1])
-        t[0] = (t[1][0] + t[3][0], new_dict)
+        t[1].append(t[3])
+        t[0] = t[1]
 
 # Return: List of strings, each string is a variable
 def p_var_list(t):
@@ -211,7 +254,8 @@ def p_var_list(t):
     if len(t) == 2:
         t[0] = [t[1]]
     if len(t) == 4:
-        t[0] = t[1] + [t[3]]
+        t[1].append(t[3])
+        t[0] = t[1]
 
 # Return: String that represent the value
 def p_value(t):
@@ -219,144 +263,134 @@ def p_value(t):
              | INT'''
     t[0] = t[1]
 
-# Return: String that represent the subarray
+# Return: DataVar with a section for each pair of brackets
 def p_subarray(t):
     '''subarray : var_name LBRACKET between_other_marks RBRACKET
                 | subarray LBRACKET between_other_marks RBRACKET'''
-    t[0] = t[1] + '[' + "".join(t[3]) + ']'
+    if isinstance(t[1], DataVar):
+        t[1].sections.append("".join(t[3]))
+        t[0] = t[1]
+    else:
+        t[0] = DataVar(t[1], ["".join(t[3])])
 
+# Return: DataVar of the variable or of the subarray
 def p_data_var(t):
     '''data_var : subarray
                 | var_name'''
-    t[0] = t[1]
+    if isinstance(t[1], DataVar):
+        t[0] = t[1]
+    else:
+        t[0] = DataVar(t[1])
 
-# Return: List of strings, each string is a variable or a subarray
+# Return: List of DataVar
 def p_data_var_list(t):
     '''data_var_list : data_var
                      | data_var_list COMMA data_var'''
     if len(t) == 2:
         t[0] = [t[1]]
     if len(t) == 4:
-        t[0] = t[1] + [t[3]]
+        t[1].append(t[3])
+        t[0] = t[1]
 
 ############################# BEGIN CONTRUCTIONS #############################
 
-# Return: List of lists. Each list represents a construct and is a list of 
-# strings
+# Return: Directive of the construct with its list of Clause
 def p_construct_parallel_loop(t):
     '''construct : PARALLEL LOOP clause_list
                  | PARALLEL LOOP '''
     if len(t) == 4:
-        t[0] = [['parallel for'] + t[3][0]]
-        has_copy = False
-        data_clauses = []
-        if 'copy' in t[3][1].keys():
-            data_clauses += ['map(tofrom:' + t[3][1]['copy'] + ')']
-            has_copy = True
-        if 'copyin' in t[3][1].keys():
-            data_clauses += ['map(to:' + t[3][1]['copyin'] + ')']
-            has_copy = True
-        if 'copyout' in t[3][1].keys():
-            data_clauses += ['map(from:' + t[3][1]['copyout'] + ')']
-            has_copy = True
-        if 'create' in t[3][1].keys():
-            data_clauses += ['map(alloc:' + t[3][1]['create'] + ')']
-            has_copy = True
-        if has_copy:
-            t[0] = [ ['target data'] + data_clauses ] + t[0]
-
+        t[0] = Directive('parallel loop', t[3])
     else:
-        t[0] = [['parallel for']]
+        t[0] = Directive('parallel loop')
 
-
-# Return: List of lists. Each list represents a construct and is a list of 
-# strings
+# Return: Directive of the construct with its list of Clause
 def p_construct_parallel(t):
     '''construct : PARALLEL clause_list
                  | PARALLEL ''' 
     if len(t) == 3:
-        t[0] = [['parallel'] + t[2][0]]
-        has_copy = False
-        data_clauses = []
-        if 'copy' in t[2][1].keys():
-            data_clauses += ['map(tofrom:' + t[2][1]['copy'] + ')']
-            has_copy = True
-        if 'copyin' in t[2][1].keys():
-            data_clauses += ['map(to:' + t[2][1]['copyin'] + ')']
-            has_copy = True
-        if 'copyout' in t[2][1].keys():
-            data_clauses += ['map(from:' + t[2][1]['copyout'] + ')']
-            has_copy = True
-        if 'create' in t[2][1].keys():
-            data_clauses += ['map(alloc:' + t[2][1]['create'] + ')']
-            has_copy = True
-        if has_copy:
-            t[0] = [ ['target data'] + data_clauses ] + t[0]
+        t[0] = Directive('parallel', t[2])
+    else:
+        t[0] = Directive('parallel')
+
+# Return: Directive of the construct with its list of Clause
+def p_construct_kernels_loop(t):
+    '''construct : KERNELS LOOP clause_list
+                 | KERNELS LOOP '''
+    if len(t) == 4:
+        t[0] = Directive('kernels loop', t[3])
     else:
-        t[0] = [['parallel']]
+        t[0] = Directive('kernels loop')
 
-# Return: List of lists. Each list represents a construct and is a list of 
-# strings
+# Return: Directive of the construct with its list of Clause
+def p_construct_kernels(t):
+    '''construct : KERNELS clause_list
+                 | KERNELS '''
+    if len(t) == 3:
+        t[0] = Directive('kernels', t[2])
+    else:
+        t[0] = Directive('kernels')
+
+# Return: Directive of the construct with its list of Clause
 def p_construct_loop(t):
     '''construct : LOOP clause_list
                  | LOOP '''
     if len(t) >= 3:
-        t[0] = [['for'] + t[2][0]]
-        if 'gang' in t[2][1].keys():
-            t[0] = [ ['teams'] ] + t[0]
+        t[0] = Directive('loop', t[2])
     else:
-        t[0] = [['for']]
+        t[0] = Directive('loop')
 
-# Return: List of lists. Each list represents a construct and is a list of 
-# strings
+# Return: Directive of the construct with its list of Clause. A pragma with
+# no construct opens a data region
 def p_construct_data(t):
     '''construct : DATA clause_list
                  | ''' 
     if len(t) == 3:
-        t[0] = [['target data'] + t[2][0]]
-        if 'copy' in t[2][1].keys():
-            t[0][0] += ['map(tofrom:' + t[2][1]['copy'] + ')']
-        if 'copyin' in t[2][1].keys():
-            t[0][0] += ['map(to:' + t[2][1]['copyin'] + ')']
-        if 'copyout' in t[2][1].keys():
-            t[0][0] += ['map(from:' + t[2][1]['copyout'] + ')']
-        if 'create' in t[2][1].keys():
-            t[0][0] += ['map(alloc:' + t[2][1]['create'] + ')']
+        t[0] = Directive('data', t[2])
     else:
-        t[0] = [['target data']]
+        t[0] = Directive('data')
+
+# Return: Directive of the construct with its list of Clause
+def p_construct_enter_data(t):
+    'construct : ENTER DATA clause_list'
+    t[0] = Directive('enter data', t[3])
+
+# Return: Directive of the construct with its list of Clause
+def p_construct_exit_data(t):
+    'construct : EXIT DATA clause_list'
+    t[0] = Directive('exit data', t[3])
+
+# Return: Directive of the construct with its list of Clause
+def p_construct_update(t):
+    'construct : UPDATE clause_list'
+    t[0] = Directive('update', t[2])
 
 ################################ BEGIN CLAUSES ################################
 
-# Return: Tuple, first element is a list with a single string and the second 
-# element is a dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with the number of workers as value
 def p_clause_num_workers(t):
     'clause : NUM_WORKERS LPAREN INT RPAREN'
-    t[0] = ( ['num_threads(' + t[3] + ')'], {'num_workers':t[3]} )
+    t[0] = Clause('num_workers', value=t[3])
 
-# Return: Tuple, first element is a list with a single string and the second 
-# element is a dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with the vector length as value, if it is given
 def p_clause_vector(t):
     '''clause : VECTOR LPAREN INT RPAREN
               | VECTOR'''
     if len(t) == 5:
-        t[0] = ( ['simd simdlen(' + t[3] + ')'], {'vector':t[3]} )
+        t[0] = Clause('vector', value=t[3])
     else:
-        t[0] = ( ['simd'], {'vector':None} )
+        t[0] = Clause('vector')
 
-# Return: Tuple, first element is a list with a single string and the second 
-# element is a dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with the number of loops as value
 def p_clause_collapse(t):
     '''clause : COLLAPSE LPAREN INT RPAREN'''
-    t[0] = ( ['collapse(' + t[3] + ')'], {'collapse':t[3]} )
+    t[0] = Clause('collapse', value=t[3])
 
-# Return: Tuple, first element is a empty list and the second element is a 
-# dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause without argument
 def p_clause_independent(t):
     'clause : INDEPENDENT'
-    t[0] = ( [], {'independent':None} )
+    t[0] = Clause('independent')
 
-# Return: Tuple, first element is a list with a single string and the second 
-# element is a dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with the operator and the list of reduced variables
 def p_clause_reduction(t):
     '''clause : REDUCTION LPAREN SUM COLON var_list RPAREN
               | REDUCTION LPAREN MUL COLON var_list RPAREN
@@ -367,52 +401,66 @@ def p_clause_reduction(t):
               | REDUCTION LPAREN AND COLON var_list RPAREN
               | REDUCTION LPAREN OR COLON var_list RPAREN
               | REDUCTION LPAREN MODULE COLON var_list RPAREN '''
+    t[0] = Clause('reduction', operator=t[3], variables=t[5])
 
-    # Transform the var_list into a unique string
-    var_list = ", ".join(t[5])
-    t[0] = ( ['reduction('+ t[3] + ':' + var_list + ')'], \
-            {'reduction':(t[3], var_list)} )
-
-# Return: Tuple, first element is a empty list and the second element is a 
-# dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with its list of DataVar
 def p_clause_copy(t):
     'clause : COPY LPAREN data_var_list RPAREN'
-    data_var_list = ", ".join(t[3])
-    #t[0] = ['map(tofrom:' + data_var_list + ')']
-    t[0] = ( [], {'copy':data_var_list} )
+    t[0] = Clause('copy', variables=t[3])
 
-# Return: Tuple, first element is a empty list and the second element is a 
-# dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with its list of DataVar
 def p_clause_copyin(t):
     'clause : COPYIN LPAREN data_var_list RPAREN'
-    data_var_list = ", ".join(t[3])
-    #t[0] = ['map(to:' + data_var_list + ')']
-    t[0] = ( [], {'copyin':data_var_list} )
+    t[0] = Clause('copyin', variables=t[3])
 
-# Return: Tuple, first element is a empty list and the second element is a 
-# dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with its list of DataVar
 def p_clause_copyout(t):
     'clause : COPYOUT LPAREN data_var_list RPAREN'
-    data_var_list = ", ".join(t[3])
-    #t[0] = ['map(from:' + data_var_list + ')']
-    t[0] = ( [], {'copyout':data_var_list} )
+    t[0] = Clause('copyout', variables=t[3])
 
-# Return: Tuple, first element is a empty list and the second element is a 
-# dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with its list of DataVar
 def p_clause_create(t):
     'clause : CREATE LPAREN data_var_list RPAREN'
-    data_var_list = ", ".join(t[3])
-    #t[0] = ['map(alloc:' + data_var_list + ')']
-    t[0] = ( [], {'create':data_var_list} )
+    t[0] = Clause('create', variables=t[3])
+
+# Return: Clause with its list of DataVar
+def p_clause_delete(t):
+    'clause : DELETE LPAREN data_var_list RPAREN'
+    t[0] = Clause('delete', variables=t[3])
+
+# Return: Clause with its list of DataVar
+def p_clause_host(t):
+    'clause : HOST LPAREN data_var_list RPAREN'
+    t[0] = Clause('host', variables=t[3])
 
-# Return: Tuple, first element is a empty list and the second element is a 
-# dictionary where the key 'clause_name' get the clause parameter
+# Return: Clause with its list of DataVar
+def p_clause_device(t):
+    'clause : DEVICE LPAREN data_var_list RPAREN'
+    t[0] = Clause('device', variables=t[3])
+
+# Return: Clause without argument
 def p_clause_gang(t):
     'clause : GANG'
-    t[0] = ( [], {'gang':None} )
+    t[0] = Clause('gang')
+
+# Return: Clause with the number of workers as value, if it is given
+def p_clause_worker(t):
+    '''clause : WORKER LPAREN INT RPAREN
+              | WORKER'''
+    if len(t) == 5:
+        t[0] = Clause('worker', value=t[3])
+    else:
+        t[0] = Clause('worker')
 
+# The grammar has no error productions, so the parsing stops at the first
+# error. The translation API then leaves the pragma untranslated or reports
+# its line
 def p_error(t):
-    print("Syntax error at '%s'" % t.value)
+    if t is None:
+        raise SyntaxError("unexpected end of input")
+    if t.type == 'EPRAGMA':
+        raise SyntaxError("unexpected end of pragma")
+    raise SyntaxError("syntax error at '%s'" % t.value)
 
 #I_TARGET = 0
 #I_PARALLEL_FOR_KERNELS = 3
@@ -424,15 +472,883 @@ def p_error(t):
 ## input_lines[i][0] -> 
 #input_lines = []
 
-if __name__ == '__main__':
+############################ BEGIN TRANSLATION API ############################
+
+# The lexer and the parser are built on the first translation and shared by
+# every translation done afterwards in the same process. The scanner is a
+# clone of the lexer used to find where each pragma ends
+_lexer = None
+_parser = None
+_scanner = None
+_signature = None
+
+# TranslationStats of the translation in progress, if it is collecting them
+_stats = None
+
+# Diagnostics of the translation in progress, if it leaves the pragmas it
+# cannot translate in the output instead of stopping
+_diagnostics = None
+
+# DataMerges of the translation in progress, if it merges the adjacent data
+# regions
+_merges = None
+
+# Matches the lines that may hold a pragma. The lexer only produces a BPRAGMA
+# token usable by the grammar when '#pragma' is preceded by white spaces, so
+# every other line is copied to the output without being parsed
+_pragma_line = re.compile(r'^[^\S\n]*\#[ ]*pragma', re.MULTILINE)
+_pragma_line_bytes = re.compile(br'^[^\S\n]*\#[ ]*pragma', re.MULTILINE)
+
+# Matches the beginning of the pragmas the grammar translates, as the lexer
+# reads them. The other pragmas, '#pragma once' or '#pragma omp' for
+# instance, are copied to the output as they are
+_translated_pragma = re.compile(r'[^\S\n]*\#[ ]*pragma[\s\\]*'
+                                r'(?:acc|scop|endscop)\b')
+_translated_pragma_bytes = re.compile(br'[^\S\n]*\#[ ]*pragma[\s\\]*'
+                                      br'(?:acc|scop|endscop)\b')
+
+# Return: Position of the beginning of the first line holding a pragma from
+# the beginning of line 'pos' of 'text', -1 when there is none. The word
+# 'pragma' is searched first and the regular expression is only tried on
+# its line, which is much faster than searching with the regular expression.
+# 'text' may also be a bytes-like object
+def _find_pragma(text, pos):
+    if isinstance(text, str):
+        word, newline, pragma_line = 'pragma', '\n', _pragma_line
+    else:
+        word, newline, pragma_line = b'pragma', b'\n', _pragma_line_bytes
+    while True:
+        found = text.find(word, pos)
+        if found < 0:
+            return -1
+        start = text.rfind(newline, pos, found) + 1 or pos
+        if pragma_line.match(text, start):
+            return start
+        # Only the first 'pragma' of a line can follow its '#'
+        end = text.find(newline, found)
+        if end < 0:
+            return -1
+        pos = end + 1
+
+# Encoding of the pragmas found by the memory-mapped translation and of the
+# files read as text. The bytes that are not valid in it go through the
+# translations unchanged, as the surrogates of the 'surrogateescape' errors
+MMAP_ENCODING = 'utf-8'
+
+# Name of the modules holding the lexer and the parser tables. Both are
+# shipped next to this file and are generated with --build-tables
+LEXTAB = 'lextab'
+PARSETAB = 'parsetab'
+
+# Return: True when the shipped lexer table matches the rules of the lexer.
+# The lexer does not check its table when it is loaded in optimized mode, so
+# the master regular expression and the tokens are compared here
+def _lextab_is_current():
+    try:
+        table = __import__(LEXTAB)
+    except ImportError:
+        return False
+    rules = [f for name, f in vars(lexrules).items()
+             if name.startswith('t_') and name != 't_error' and callable(f)]
+    rules.sort(key=lambda f: f.__code__.co_firstlineno)
+    master = '|'.join('(?P<%s>%s)' % (f.__name__, f.__doc__) for f in rules)
+    return (table._lextokens == set(lexrules.tokens) and
+            [regex for regex, names in table._lexstatere['INITIAL']] == [master])
+
+# Return: Tuple with the shared lexer and the shared LRParser. The shipped
+# tables are loaded without validating the rules again and nothing is ever
+# written to disk: if a table is out of date the lexer or the parser is
+# built in memory instead
+def get_parser():
+    global _lexer, _parser, _scanner
+    if _parser is None:
+        if _lextab_is_current():
+            _lexer = lex.lex(module=lexrules, optimize=True, lextab=LEXTAB)
+        else:
+            _lexer = lex.lex(module=lexrules)
+        # Control variable to generate a token to end of prama (EPRAGMA)
+        _lexer.in_pragma = 0
+        _scanner = _lexer.clone()
+        try:
+            table = __import__(PARSETAB)
+            optimize = table._lr_signature == grammar_signature()
+        except ImportError:
+            optimize = False
+        _parser = yacc.yacc(module=sys.modules[__name__], tabmodule=PARSETAB,
+                            optimize=optimize, write_tables=False, debug=False)
+    return _lexer, _parser
+
+# Write the lexer and the parser tables to the directory 'outputdir', by
+# default the directory of this file
+def build_tables(outputdir=None):
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+    lex.lex(module=lexrules).writetab(LEXTAB, outputdir)
+    # Remove the tables in use so yacc does not reuse them
+    sys.modules.pop(PARSETAB, None)
+    path = os.path.join(outputdir, PARSETAB + '.py')
+    if os.path.exists(path):
+        os.remove(path)
+    yacc.yacc(module=sys.modules[__name__], tabmodule=PARSETAB,
+              outputdir=outputdir, debug=False)
 
-    lexer = lex.lex(module=lexrules)
-    # Control variable to generate a token to end of prama (EPRAGMA)
+# Return: String with the signature of the grammar, the same one yacc uses to
+# know if the parsing tables are up to date
+def grammar_signature():
+    global _signature
+    if _signature is None:
+        module = sys.modules[__name__]
+        pinfo = yacc.ParserReflect(dict((k, getattr(module, k)) for k in dir(module)))
+        pinfo.get_all()
+        _signature = pinfo.signature()
+    return _signature
+
+# Return: Position just after the last line of the pragma starting at 'start'.
+# The lines are lexed one by one until the lexer leaves the pragma, so the
+# backslash continuations are followed exactly as the parser would do. 'text'
+# may also be a bytes-like object, its lines are then decoded before lexing.
+# A line without backslash and with a single '#' holds a single BPRAGMA and
+# nothing that continues it, so it is not lexed
+def _pragma_end(text, start):
+    binary = not isinstance(text, str)
+    newline = b'\n' if binary else '\n'
+    end = text.find(newline, start)
+    end = len(text) if end < 0 else end + 1
+    line = text[start:end]
+    if (b'\\' if binary else '\\') not in line and \
+            line.count(b'#' if binary else '#') == 1:
+        # The lexer would still be in the pragma without the new line
+        _scanner.in_pragma = 0 if line.endswith(newline) else 1
+        return end
+    _scanner.in_pragma = 0
+    pos = start
+    while True:
+        end = text.find(newline, pos)
+        end = len(text) if end < 0 else end + 1
+        line = text[pos:end]
+        if binary:
+            line = line.decode(MMAP_ENCODING, 'surrogateescape')
+        _scanner.input(line)
+        for token in _scanner:
+            pass
+        pos = end
+        if _scanner.in_pragma == 0 or pos == len(text):
+            return pos
+
+# Return: List of Pragma and of strings built by the grammar from 'text'.
+# 'lineno' is the line of the input where the text starts
+def _parse(text, lineno=1):
+    lexer, parser = get_parser()
+    # A previous translation may have stopped in the middle of a pragma
     lexer.in_pragma = 0
-    parser = yacc.yacc()
+    lexer.lineno = lineno
+    if _stats is None:
+        result = parser.parse(text, lexer=lexer)
+    else:
+        result = _stats.parse(parser, text, lexer)
+    if result is None:
+        raise SyntaxError('Unable to translate the input at line %d' % lineno)
+    return result
+
+# Maximum number of pragma translations kept in memory
+PRAGMA_CACHE_SIZE = 4096
+
+# Pragmas built from the normalized pragmas already seen, the least recently
+# used ones are dropped first. The emitter writes them again on every use
+_cached_parse = functools.lru_cache(maxsize=PRAGMA_CACHE_SIZE)(_parse)
+
+# Matches the white spaces that the lexer drops inside a pragma
+_pragma_spaces = re.compile(r'[^\S\n]+')
+
+# Return: String with the pragma 'text' written in a canonical way, so the
+# pragmas that only differ by white spaces share the same translation. Every
+# white space before the '#' gives a space in the translation, so only the
+# white spaces after it are merged
+def _normalize_pragma(text):
+    body = text.lstrip()
+    return ' ' * (len(text) - len(body)) + _pragma_spaces.sub(' ', body)
+
+# Return: Pragma built from the pragma 'text', shared with its translations.
+# SyntaxError is raised when it cannot be parsed
+def parse_pragma(text):
+    get_parser()
+    for item in _cached_parse(_normalize_pragma(text)):
+        if isinstance(item, Pragma):
+            return item
+    raise SyntaxError('No pragma in the input')
+
+# Return: List of Pragma and of strings built from the pragma 'text', shared
+# with its other occurrences. SyntaxError is raised when it cannot be parsed
+def _pragma_items(text):
+    return _cached_parse(_normalize_pragma(text))
+
+# Count the pragma of 'items', built by _pragma_items or None when it could
+# not be parsed, in the statistics when they are collected
+def _count_pragma(items):
+    if _stats is not None:
+        _stats.add_pragma(items)
+
+# Return: String with the text of 'items', built by _pragma_items, found in
+# the list 'regions' of open regions, as _translate_text keeps them. The data
+# of the open regions is found on the device and not copied again, and the
+# loops only take the levels of parallelism left by their enclosing loops.
+# 'inner' is the nesting of the region the pragma opens, as _region gives it
+def _emit_items(items, regions, inner=None):
+    if not regions:
+        return emitter.emit(items, None, inner)
+    present = frozenset().union(*[region[1] for region in regions])
+    items = [merge.present_pragma(item, present)
+             if isinstance(item, Pragma) else item for item in items]
+    return emitter.emit(items, regions[-1][3], inner)
+
+# Return: Tuple with the set of the names of the data that the pragma of
+# 'items' holds on the device for the statement that follows it and with the
+# nesting of that statement, as emitter.nesting gives it. None when the
+# statement is not tracked: the pragma opens no region and is not a loop of
+# a compute construct. 'outer' is the nesting of the pragma and 'loops'
+# tells that the statement only runs loops, as _loops_region finds it
+def _region(items, outer, loops=False):
+    for item in items:
+        if isinstance(item, Pragma):
+            construct = item.directive.construct
+            if construct in merge.REGIONS or \
+                    (construct == 'loop' and outer is not None):
+                return (merge.data_names(item.directive),
+                        emitter.nesting(item.directive, outer, loops))
+    return None
+
+# Return: True when 'items' hold a kernels region of the device whose
+# statement, from 'end' to 'stop' of 'text', only runs loops, which are then
+# offloaded one by one. 'text' may also be a bytes-like object, the
+# statement is then decoded
+def _loops_region(items, text, end, stop):
+    if emitter.target != 'device' or \
+            not any(isinstance(item, Pragma) and
+                    item.directive.construct == 'kernels' for item in items):
+        return False
+    if not isinstance(text, str):
+        text = text[end:stop].decode(MMAP_ENCODING, 'surrogateescape')
+        end = 0
+    return _pragma_statements(text, end,
+                              lambda directive: directive.construct == 'loop')
+
+# Return: Position just after the statement of the region whose pragma
+# ends at 'end' of 'text', -1 when it does not end within REGION_WINDOW
+# characters. The region is then not known to the pragmas inside it
+def _region_end(text, end):
+    return merge.statement_end(text, end, end + REGION_WINDOW)
+
+# Return: Position just after the statement of the region whose pragma
+# ends at 'end' of the bytes 'data', as _region_end finds it in the decoded
+# text. Growing windows of the bytes are decoded until the statement ends
+# or the window holds REGION_WINDOW characters
+def _region_end_bytes(data, end):
+    window = REGION_WINDOW
+    size = 1 << 12
+    while True:
+        stop = min(end + size, len(data))
+        # A character cut in two would not decode as in the whole text
+        while end < stop < len(data) and 0x80 <= data[stop] < 0xc0:
+            stop -= 1
+        text = data[end:stop].decode(MMAP_ENCODING, 'surrogateescape')
+        close = merge.statement_end(text, 0, window)
+        if close >= 0:
+            return end + len(text[:close].encode(MMAP_ENCODING,
+                                                 'surrogateescape'))
+        if stop >= len(data) or len(text) >= window:
+            return -1
+        size *= 2
+
+# Return: String written in place of the pragma 'text' found at line 'lineno'
+# that could not be translated because of 'error'. When the diagnostics are
+# collected, the pragma is recorded and written as it is, otherwise
+# SyntaxError is raised
+def _untranslated(text, lineno, error):
+    if _diagnostics is None:
+        raise SyntaxError('Unable to translate the input at line %d: %s'
+                          % (lineno, error))
+    _diagnostics.add(lineno, text.rstrip('\n'), str(error))
+    return text
+
+# Set the maximum number of pragma translations kept in memory, dropping the
+# ones kept so far
+def set_pragma_cache_size(size):
+    global _cached_parse
+    _cached_parse = functools.lru_cache(maxsize=size)(_parse)
+
+# Return: Named tuple with the hits, misses, maximum size and current size of
+# the pragma translations kept in memory
+def pragma_cache_info():
+    return _cached_parse.cache_info()
+
+# Make the translation done inside the block count into the TranslationStats
+# 'stats', record the pragmas it cannot translate in the Diagnostics
+# 'diagnostics' and merge the adjacent data regions into the DataMerges
+# 'merges', when they are given.
+# Return: Function that calls 'write' and, when 'stats' is given, times it
+@contextlib.contextmanager
+def _collecting(stats, write, diagnostics=None, merges=None):
+    global _stats, _diagnostics, _merges
+    _diagnostics = diagnostics
+    _merges = merges
+    try:
+        if stats is None:
+            yield write
+            return
+        _stats = stats
+        stats.start(pragma_cache_info())
+        try:
+            yield stats.timed_write(write)
+        finally:
+            stats.stop(pragma_cache_info())
+            _stats = None
+    finally:
+        _diagnostics = None
+        _merges = None
+
+# Return: True when the statement of the region whose pragma ends at 'end' of
+# 'text' only holds statements of pragmas, alone or in a compound statement,
+# whose Directive the function 'accept' accepts
+def _pragma_statements(text, end, accept):
+    pos = merge.skip_blank(text, end)
+    compound = text.startswith('{', pos)
+    if compound:
+        pos = merge.skip_blank(text, pos + 1)
+    while True:
+        if compound and text.startswith('}', pos):
+            return True
+        start = text.rfind('\n', 0, pos) + 1
+        if text[start:pos].strip() or not _pragma_line.match(text, start):
+            return False
+        end = _pragma_end(text, start)
+        if _scanner.in_pragma > 0:
+            return False
+        try:
+            directive = parse_pragma(text[start:end]).directive
+        except SyntaxError:
+            return False
+        if not accept(directive):
+            return False
+        stop = merge.statement_end(text, end)
+        if stop < 0:
+            return False
+        if not compound:
+            return True
+        pos = merge.skip_blank(text, stop)
+
+# Return: True when the statement of the data region whose pragma ends at
+# 'end' of 'text' only runs compute constructs whose data is all in the set
+# of names 'names' the region maps. The host then runs nothing in the region
+# and the compute constructs transfer nothing, so the region can be merged
+# as a compute construct
+def _device_only(text, end, names):
+    return _pragma_statements(
+        text, end, lambda directive: directive.construct in merge.COMPUTE and
+        merge.data_names(directive) <= names)
+
+# Return: Tuple with the text opening the data region that merges the run
+# of adjacent regions of 'text' starting with the pragma between 'start' and
+# 'end', found at line 'lineno', the position where the last statement of
+# the run ends and the set of the names of its data. The tuple is
+# ('', -1, None) when the run has fewer than two regions or saves no
+# transfer. 'at_start' tells if 'text' is the beginning of the file
+def _merge_run(text, start, end, lineno, at_start):
+    directives = []
+    indent = None
+    close = -1
+    while True:
+        try:
+            pragma = parse_pragma(text[start:end])
+        except SyntaxError:
+            break
+        if not merge.compatible(directives, pragma.directive):
+            break
+        if not directives and merge.may_be_body(text, start, at_start):
+            break
+        if pragma.directive.construct == 'data' and not _device_only(
+                text, end, merge.data_names(pragma.directive)):
+            break
+        stop = merge.statement_end(text, end)
+        if stop < 0:
+            break
+        directives.append(pragma.directive)
+        if indent is None:
+            indent = pragma.indent
+        close = stop
+        # The next region must start on the next line that is not blank
+        start = merge.skip_blank(text, stop)
+        start = text.rfind('\n', 0, start) + 1
+        if start < stop or not _pragma_line.match(text, start):
+            break
+        end = _pragma_end(text, start)
+        if _scanner.in_pragma > 0:
+            break
+    if len(directives) < 2:
+        return '', -1, None
+    directive, saved = merge.merged_region(directives)
+    if not any(count for variable, count in saved):
+        return '', -1, None
+    _merges.add(lineno, len(directives), saved)
+    return (emitter.emit_pragma(Pragma(indent, directive)) +
+            ' ' * indent + '{\n'), close, merge.data_names(directive)
+
+# Translate 'text' and give the result to 'write' piece by piece. Only the
+# OpenACC pragmas and the scop markers go through the parser, the other
+# lines and pragmas are copied verbatim. When 'final' is false, a pragma
+# continued past the end of 'text' is left for the next call. 'marker' is a
+# linemarker format written after each pragma whose translation does not
+# have as many lines as the input. When the data regions are merged, the
+# merged region is opened before the first pragma of a run and closed on the
+# line where its last statement ends. 'regions' is the list of the regions
+# open at the beginning of 'text', tuples of the position where the
+# statement of the region ends, of the set of the names of its data, of
+# whether it is a merged region to close and of the nesting of its
+# statement. The loops of the compute constructs are regions too. The data
+# of the open regions is not copied again by the pragmas inside them.
+# The list is updated with the regions still open where the translation
+# stops, whose positions are then relative to that position.
+# Return: Tuple with the position where the translation stopped and the line
+# number at that position
+def _translate_text(text, write, lineno=1, final=True, marker=None,
+                    regions=None):
+    at_start = lineno == 1
+    if regions is None:
+        regions = []
+    pos = 0
+    while True:
+        start = _find_pragma(text, pos)
+        found = start >= 0
+        if not found:
+            start = len(text)
+        # The regions end in the reverse order they were opened
+        while regions and regions[-1][0] <= start:
+            close, names, merged, outer = regions.pop()
+            if merged:
+                lineno += text.count('\n', pos, close)
+                write(text[pos:close])
+                write(' }')
+                pos = close
+        if start > pos:
+            lineno += text.count('\n', pos, start)
+            write(text[pos:start])
+            pos = start
+        if not found:
+            break
+        end = _pragma_end(text, start)
+        if _scanner.in_pragma > 0 and not final:
+            break
+        pragma = text[start:end]
+        if not _translated_pragma.match(pragma):
+            write(pragma)
+            lineno += pragma.count('\n')
+            pos = end
+            continue
+        try:
+            items = _pragma_items(pragma)
+        except SyntaxError as e:
+            items = None
+            error = e
+        outer = regions[-1][3] if regions else None
+        region = _region(items or [], outer)
+        if region is not None:
+            close = _region_end(text, end)
+            if close >= 0:
+                if _loops_region(items, text, end, close):
+                    region = _region(items, outer, True)
+                region = (close, region[0], False, region[1])
+            # The statement of the region may end in the next call
+            elif not final and len(text) - end < REGION_WINDOW:
+                break
+            else:
+                region = None
+        _count_pragma(items)
+        opening = ''
+        if _merges is not None and not any(entry[2] for entry in regions):
+            opening, close, names = _merge_run(text, start, end, lineno,
+                                               at_start)
+            if close >= 0:
+                regions.append((close, names, True, outer))
+        if items is None:
+            result = _untranslated(pragma, lineno, error)
+        else:
+            result = _emit_items(items, regions,
+                                 region[3] if region is not None else None)
+        if region is not None:
+            regions.append(region)
+        result = opening + result
+        write(result)
+        lines = text.count('\n', start, end)
+        lineno += lines
+        if marker is not None and result.count('\n') != lines:
+            write(marker % lineno)
+        pos = end
+    regions[:] = [(close - pos, names, merged, outer)
+                  for close, names, merged, outer in regions]
+    return pos, lineno
+
+# Return: Linemarker format, with the line number left to fill, telling the
+# compiler that the next line is a line of the file 'filename'
+def _linemarker(filename):
+    name = filename.replace('\\', '\\\\').replace('"', '\\"')
+    return '# %d "' + name.replace('%', '%%') + '"\n'
+
+# Return: String with the input text translated to OpenMP. The timing and
+# the counters of the translation are added to 'stats' when it is given.
+# When 'filename' is given, linemarkers are added so the compiler reports
+# the lines of that file. 'lineno' is the line of the input where the text
+# starts. When the Diagnostics 'diagnostics' is given, the pragmas that
+# cannot be translated are recorded there and left as they are, otherwise
+# SyntaxError is raised on the first one. When the DataMerges 'merges' is
+# given, the runs of adjacent data regions sharing data are wrapped in a
+# single data region and recorded there. The data that an enclosing data or
+# compute region holds on the device is only created by the pragmas inside
+# it, never copied again
+def translate(text, stats=None, filename=None, lineno=1, diagnostics=None,
+              merges=None):
+    get_parser()
+    output = BufferSink()
+    marker = None
+    if filename is not None:
+        marker = _linemarker(filename)
+        output.write(marker % lineno)
+    with _collecting(stats, output.write, diagnostics, merges) as write:
+        if stats is not None:
+            stats.bytes_in += len(text)
+        _translate_text(text, write, lineno, marker=marker)
+    return output.getvalue()
+
+# Matches the words of the pragmas that may open a region
+_region_word = re.compile(br'parallel|kernels|data')
+
+# Return: Beginning of the first line at or after the position 'target' of
+# the bytes 'data' that is outside of any pragma and of any data region known
+# to the pragmas inside it, so the pieces of the data cut there can be
+# translated apart. Only the pragmas from REGION_WINDOW characters before the
+# line are looked at, as the statements of the others end before it, so the
+# position is found near 'target' whatever the size of the data. A pragma
+# longer than that window is the only one that could be missed
+def split_point(data, target):
+    get_parser()
+    if target <= 0:
+        return 0
+    newline = data.find(b'\n', target - 1)
+    if newline < 0:
+        return len(data)
+    point = newline + 1
+    # Point for which 'reach' was found
+    reached = -1
+    pos = None
+    # End of the last region found to end before the point. The regions of
+    # the pragmas inside its statement end before it too
+    inner = -1
+    # Move the point after the pragma continued past it
+    while True:
+        # The statement of a region ends within REGION_WINDOW characters, of
+        # a single byte before the point when they are all ASCII and of at
+        # most four otherwise
+        if reached != point:
+            reach = REGION_WINDOW
+            if not data[max(point - 4 * reach, 0):point].isascii():
+                reach *= 4
+            reached = point
+        if pos is None:
+            pos = data.rfind(b'\n', 0, max(point - reach, 0)) + 1
+        start = _find_pragma(data, pos)
+        if start < 0 or start >= point:
+            return point
+        pos = _pragma_end(data, start)
+        point = max(point, pos)
+        # Only the pragmas that may open a region are parsed
+        if pos + reach <= point or start < inner or \
+                _region_word.search(data, start, pos) is None:
+            continue
+        try:
+            text = data[start:pos].decode(MMAP_ENCODING, 'surrogateescape')
+            region = _region([parse_pragma(text)], None)
+        except SyntaxError:
+            region = None
+        if region is not None:
+            close = _region_end_bytes(data, pos)
+            if close > point:
+                point = data.find(b'\n', close - 1) + 1 or len(data)
+            else:
+                inner = max(inner, close)
+
+# Number of characters read at once by the streaming translation
+STREAM_CHUNK = 1 << 20
+
+# Number of characters after the pragma of a data region where its statement
+# must end for the pragmas inside it to know the region. The translations
+# all look that far, whatever the input is read in
+REGION_WINDOW = STREAM_CHUNK // 2
+
+# Translate the text read from the file object 'input_file' and write the
+# result to 'output_file', an OutputSink or a file object. The input is read
+# in chunks of whole lines and each chunk is written as soon as it is
+# translated, so the memory used does not depend on the size of the input.
+# The output is flushed at the end but not closed. The timing and the
+# counters of the translation are added to 'stats' when it is given and the
+# pragmas that cannot be translated are left as they are in 'diagnostics'
+# and the data regions are merged into 'merges', as translate does. A run of
+# regions is only merged when it is read in a single chunk
+def translate_stream(input_file, output_file, stats=None, diagnostics=None,
+                     merges=None):
+    get_parser()
+    if isinstance(output_file, OutputSink):
+        sink = output_file
+    else:
+        sink = StreamSink(output_file)
+    rest = ''
+    lineno = 1
+    regions = []
+    try:
+        with _collecting(stats, sink.write, diagnostics, merges) as write:
+            while True:
+                lines = input_file.readlines(STREAM_CHUNK)
+                text = rest + "".join(lines)
+                if stats is not None:
+                    stats.bytes_in += len(text) - len(rest)
+                pos, lineno = _translate_text(text, write, lineno,
+                                              final=not lines,
+                                              regions=regions)
+                if not lines:
+                    break
+                # Beginning of a pragma continued in the next chunk
+                rest = text[pos:]
+    finally:
+        sink.flush()
+    if stats is not None:
+        stats.files += 1
+
+# Translate the file 'src' and write the result to the file 'dst', as
+# translate_stream does
+def translate_file(src, dst, stats=None, diagnostics=None, merges=None):
+    with open(src, 'r', encoding=MMAP_ENCODING,
+              errors='surrogateescape') as input_file, \
+         FileSink(dst, encoding=MMAP_ENCODING,
+                  errors='surrogateescape') as output:
+        translate_stream(input_file, output, stats, diagnostics, merges)
+
+# Translate the file 'src' and write the result to the file 'dst'. The input
+# is mapped in memory and the bytes between the pragmas are written to the
+# output straight from the mapping, without being decoded. Only the pragmas
+# are decoded and parsed. 'stats' and 'diagnostics' are used as by
+# translate_stream
+def translate_mmap(src, dst, stats=None, diagnostics=None):
+    get_parser()
+    with open(src, 'rb') as input_file, FileSink(dst, binary=True) as output, \
+         _collecting(stats, output.write, diagnostics) as write:
+        size = os.fstat(input_file.fileno()).st_size
+        if stats is not None:
+            stats.bytes_in += size
+            stats.files += 1
+        # An empty file cannot be mapped
+        if size == 0:
+            return
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+             memoryview(data) as view:
+            pos = 0
+            # Line number of the position 'counted'
+            lineno = 1
+            counted = 0
+            # Data regions open, as _translate_text keeps them
+            regions = []
+            while True:
+                start = _find_pragma(data, pos)
+                found = start >= 0
+                if not found:
+                    start = len(data)
+                if start > pos:
+                    write(view[pos:start])
+                if not found:
+                    break
+                while regions and regions[-1][0] <= start:
+                    regions.pop()
+                end = _pragma_end(data, start)
+                if not _translated_pragma_bytes.match(data, start, end):
+                    write(view[start:end])
+                    pos = end
+                    continue
+                pragma = data[start:end].decode(MMAP_ENCODING, 'surrogateescape')
+                try:
+                    items = _pragma_items(pragma)
+                except SyntaxError as e:
+                    _count_pragma(None)
+                    # The lines are only counted when they are needed
+                    lineno += data[counted:start].count(b'\n')
+                    counted = start
+                    result = _untranslated(pragma, lineno, e)
+                else:
+                    _count_pragma(items)
+                    outer = regions[-1][3] if regions else None
+                    region = _region(items, outer)
+                    if region is not None:
+                        close = _region_end_bytes(data, end)
+                        if close < 0:
+                            region = None
+                        elif _loops_region(items, data, end, close):
+                            region = _region(items, outer, True)
+                    result = _emit_items(items, regions,
+                                         region[1] if region else None)
+                    if region is not None:
+                        regions.append((close, region[0], False,
+                                        region[1]))
+                write(result.encode(MMAP_ENCODING, 'surrogateescape'))
+                pos = end
+
+if __name__ == '__main__':
+
+    argparser = argparse.ArgumentParser(
+        description='Translate the OpenACC pragmas of a C file to OpenMP')
+    argparser.add_argument('input', nargs='?',
+        help='file to translate, the interactive mode is entered when omitted')
+    argparser.add_argument('output', nargs='*',
+        help="file where the translation is written, '-' for the standard "
+             "output. When omitted the input and the translation are shown. "
+             "With --output-dir, more files, directories or patterns to "
+             "translate")
+    argparser.add_argument('--mmap', action='store_true',
+        help='map the input in memory and copy the lines without pragmas '
+             'byte for byte to the output file')
+    argparser.add_argument('-o', '--output-dir',
+        help='translate every .c, .h and .cpp file of the inputs, which can '
+             'be files, directories or glob patterns, into this directory')
+    argparser.add_argument('-j', '--jobs', type=int,
+        help='number of processes used with --output-dir (default: number '
+             'of CPUs). With an output file, a large input is split and '
+             'translated on this number of processes')
+    argparser.add_argument('--cache-dir',
+        help='reuse the translations stored in this directory and store the '
+             'new ones')
+    argparser.add_argument('--cache-size', type=float, default=1024,
+        help='size limit of the cache directory in MB (default: 1024)')
+    argparser.add_argument('--cache-stats', action='store_true',
+        help='report the entries, size, hits and misses of the cache and the '
+             'hits and misses of the pragma translations kept in memory')
+    argparser.add_argument('--stats', action='store_true',
+        help='report on the standard error the time spent scanning, lexing, '
+             'parsing and writing, the tokens, the pragmas per construct and '
+             'the sizes read and written')
+    argparser.add_argument('--strict', action='store_true',
+        help='stop at the first pragma that cannot be translated, instead of '
+             'leaving it untranslated and going on')
+    argparser.add_argument('--diagnostics', metavar='FILE',
+        help='write the pragmas left untranslated to this file, one JSON '
+             'object per line with the file, the line, the pragma and the '
+             'error')
+    argparser.add_argument('--watch', action='store_true',
+        help='with --output-dir, keep running and translate the files again '
+             'when they change')
+    argparser.add_argument('--watch-interval', type=float, default=0.5,
+        help='seconds between two scans of the inputs with --watch '
+             '(default: 0.5)')
+    argparser.add_argument('--target', choices=emitter.TARGETS,
+        default=emitter.target,
+        help='where the parallel and kernels constructs run: on the threads '
+             'of the host or offloaded to the teams of a device, sharing '
+             'the loops over the teams, threads and simd lanes (default: %s)'
+             % emitter.target)
+    argparser.add_argument('--merge-data', action='store_true',
+        help='wrap the runs of adjacent data and compute regions that share '
+             'data in a single data region, so the data is transferred once, '
+             'and report the transfers saved on the standard error')
+    argparser.add_argument('--scan', action='store_true',
+        help='translate nothing and write the OpenACC pragmas of the inputs, '
+             'which can be files, directories or glob patterns, to the '
+             'standard output, one JSON object per line with the file, the '
+             'line, the construct, the clauses and the data variables')
+    argparser.add_argument('--build-tables', action='store_true',
+        help='write the lexer and parser tables next to this file and exit')
+    argparser.add_argument('--pragma-cache-size', type=int,
+        default=PRAGMA_CACHE_SIZE,
+        help='number of pragma translations kept in memory (default: %d)'
+             % PRAGMA_CACHE_SIZE)
+    args = argparser.parse_args()
+
+    if args.build_tables:
+        build_tables()
+        sys.exit(0)
+
+    if args.pragma_cache_size != PRAGMA_CACHE_SIZE:
+        set_pragma_cache_size(args.pragma_cache_size)
+    emitter.set_target(args.target)
+
+    stats = TranslationStats() if args.stats else None
+
+    if args.strict and args.diagnostics is not None:
+        argparser.error("--diagnostics cannot be used with --strict")
+    diagnostics = None if args.strict else Diagnostics(args.input)
+
+    merges = None
+    if args.merge_data:
+        if (args.output_dir is not None or args.scan or args.mmap or
+                args.jobs is not None or args.cache_dir is not None):
+            argparser.error("--merge-data needs a single input and cannot be "
+                            "used with --mmap, --jobs or --cache-dir")
+        merges = DataMerges(args.input)
+
+    cache = None
+    if args.cache_dir is not None:
+        import cache as translation_cache
+        cache = translation_cache.TranslationCache(
+            args.cache_dir, int(args.cache_size * 1e6))
+
+    if args.scan:
+        import scan
+        if args.input is None:
+            argparser.error("--scan needs at least one input")
+        if args.output_dir is not None or args.watch:
+            argparser.error("--scan cannot be used with --output-dir or --watch")
+        sys.exit(1 if scan.scan_tree([args.input] + args.output, args.jobs)
+                 else 0)
+
+    if args.output_dir is not None:
+        import batch
+        if args.input is None:
+            argparser.error("--output-dir needs at least one input")
+        try:
+            if args.watch:
+                import watch
+                failures = watch.TreeWatcher(
+                    [args.input] + args.output, args.output_dir,
+                    args.watch_interval, cache=cache, use_mmap=args.mmap,
+                    stats=stats, diagnostics=diagnostics).run()
+            else:
+                failures = batch.translate_tree(
+                    [args.input] + args.output, args.output_dir, args.jobs,
+                    cache, args.mmap, stats, diagnostics=diagnostics)
+                if diagnostics is not None:
+                    diagnostics.report(sys.stderr)
+        except ValueError as e:
+            argparser.error(str(e))
+        if args.diagnostics is not None:
+            with open(args.diagnostics, 'w') as diagnostics_file:
+                diagnostics.write_json(diagnostics_file)
+        if args.cache_stats and cache is not None:
+            print(cache.report())
+        if stats is not None:
+            sys.stderr.write(stats.report() + "\n")
+        sys.exit(1 if failures else 0)
+    elif args.jobs is not None and (len(args.output) != 1 or
+                                    args.output[0] == '-'):
+        argparser.error("--jobs needs --output-dir or an output file")
+    elif args.jobs is not None and args.mmap:
+        argparser.error("--jobs cannot be used with --mmap and an output file")
+    elif args.watch:
+        argparser.error("--watch needs --output-dir")
+    elif len(args.output) > 1:
+        argparser.error("only one output file can be given")
+    args.output = args.output[0] if args.output else None
+
+    # Only report the state of the cache
+    if args.cache_stats and args.input is None:
+        if cache is None:
+            argparser.error("--cache-stats needs an input or --cache-dir")
+        print(cache.report())
+        sys.exit(0)
 
     # If no input file was passed
-    if len(sys.argv) == 1:
+    if args.input is None:
         print("No input passed, entering the interactive mode")
 
         while True:
@@ -442,29 +1358,78 @@ if __name__ == '__main__':
                 print()
                 break
             s = s + "\n"
-            result = parser.parse(s)
+            try:
+                result = translate(s)
+            except SyntaxError:
+                result = None
             print(result)
 
     else:
 
-        filename = sys.argv[1]
-        with open(filename, 'r') as input_file:
-            input_to_parse = input_file.read()
+        filename = args.input
 
-        if len(sys.argv) == 2:
+        if args.output is None:
+            with open(filename, 'r') as input_file:
+                input_to_parse = input_file.read()
             print("Input:")
             print("---------------------------------------------------")
             print(input_to_parse)
             print("---------------------------------------------------")
             print("Result:")
             print("---------------------------------------------------")
-            result = parser.parse(input_to_parse)
+            try:
+                result = translate(input_to_parse, stats,
+                                   diagnostics=diagnostics, merges=merges)
+            except SyntaxError:
+                result = None
             print(result)
             print("---------------------------------------------------")
 
+        # A '-' as output file writes the translation to the standard output
+        elif args.output == '-':
+            if args.mmap:
+                argparser.error("--mmap needs an output file")
+            if cache is not None:
+                argparser.error("--cache-dir needs an output file")
+            with open(filename, 'r') as input_file:
+                try:
+                    translate_stream(input_file, sys.stdout, stats,
+                                     diagnostics, merges)
+                except SyntaxError as e:
+                    sys.exit("%s: %s" % (filename, e))
+
         else:
-            result = parser.parse(input_to_parse)
-            filename = sys.argv[2]
-            with open(filename, 'w') as output_file:
-                output_file.write(result)
-            os.chmod(filename, 0o666)
+            translate_function = translate_mmap if args.mmap else translate_file
+            if args.jobs is not None:
+                import batch
+                translate_function = batch.parallel_translator(args.jobs)
+            try:
+                if cache is not None:
+                    cache.translate_file(filename, args.output,
+                                         translate_function, stats,
+                                         diagnostics)
+                elif merges is not None:
+                    translate_file(filename, args.output, stats, diagnostics,
+                                   merges)
+                else:
+                    translate_function(filename, args.output, stats,
+                                       diagnostics)
+            except SyntaxError as e:
+                sys.exit("%s: %s" % (filename, e))
+            os.chmod(args.output, 0o666)
+            if args.cache_stats:
+                if cache is not None:
+                    print(cache.report())
+                info = pragma_cache_info()
+                print("pragma cache: %d entries of %d, %d hits, %d misses"
+                      % (info.currsize, info.maxsize, info.hits, info.misses))
+
+        if diagnostics is not None:
+            diagnostics.report(sys.stderr)
+            if args.diagnostics is not None:
+                with open(args.diagnostics, 'w') as diagnostics_file:
+                    diagnostics.write_json(diagnostics_file)
+        if merges is not None:
+            merges.report(sys.stderr)
+        if stats is not None:
+            sys.stderr.write(stats.report() + "\n")
@@ -0,0 +1,183 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'nonassocPARALLELKERNELSnonassocLOOPACC AND BACKSLASH BITWISE_AND BITWISE_OR BPRAGMA COLLAPSE COLON COMMA COPY COPYIN COPYOUT CREATE DATA DELETE DEVICE ENDSCOP ENTER EPRAGMA EXIT GANG HOST ID INDEPENDENT INT KERNELS LBRACKET LOOP LPAREN MAX MIN MODULE MUL NEWLINE NUM_WORKERS OR OTHER PARALLEL RBRACKET REDUCTION RPAREN SCOP SPACE SUM TAB UPDATE VECTOR WORKERprogram : lineslines : lines pragmalines : lines ignored_line\n             | ignored_line : spaces NEWLINE\n                    | spaces solid anything NEWLINEanything : anything OTHER\n                | anything INT\n                | anything word\n                | anything other_mark\n                | anything whitespace\n                | anything operator\n                | anything ponctuation\n                | pragma : spaces BPRAGMA ACC construct EPRAGMApragma : spaces BPRAGMA SCOP EPRAGMApragma : spaces BPRAGMA ENDSCOP EPRAGMAspaces : spaces whitespace\n              | solid : OTHER\n             | INT\n             | word\n             | other_mark\n             | operator\n             | ponctuationwhitespace : SPACE\n                  | TABword : ACC \n            | SCOP \n            | ENDSCOP \n            | PARALLEL \n            | KERNELS \n            | LOOP \n            | NUM_WORKERS \n            | VECTOR \n            | COLLAPSE \n            | REDUCTION \n            | INDEPENDENT \n            | COPY \n            | COPYIN \n            | COPYOUT \n            | CREATE \n            | GANG \n            | WORKER \n            | DATA \n            | ENTER \n            | EXIT \n            | UPDATE \n            | DELETE \n            | HOST \n            | DEVICE \n            | IDoperator : SUM \n                | MUL \n                | MAX \n                | MIN \n                | BITWISE_AND \n                | BITWISE_OR \n                | AND \n                | OR \n                | MODULEponctuation : COLON \n                   | COMMAother_mark : LPAREN \n                  | RPAREN \n                  | RBRACKET \n                  | LBRACKET \n                  | BACKSLASHbetween_other_marks : between_other_marks OTHER\n                           | between_other_marks INT\n                           | between_other_marks word\n                           | between_other_marks whitespace\n                           | between_other_marks operator\n                           | between_other_marks ponctuation\n                           | possible_comma : COMMA\n                      | var_name : ID\n                | ACC\n                | SCOP\n                | ENDSCOP\n                | PARALLEL\n                | KERNELS\n                | LOOP\n                | NUM_WORKERS\n                | VECTOR\n                | COLLAPSE\n                | REDUCTION\n                | INDEPENDENT\n                | COPY\n                | COPYIN\n                | COPYOUT\n                | CREATE\n                | GANG\n                | WORKER\n                | DATA\n                | ENTER\n                | EXIT\n                | UPDATE\n                | DELETE\n                | HOST\n                | DEVICEclause_list : clause\n                   | clause_list possible_comma clausevar_list : var_name\n                | var_list COMMA var_namevalue : var_name \n             | INTsubarray : var_name LBRACKET between_other_marks RBRACKET\n                | subarray LBRACKET between_other_marks RBRACKETdata_var : subarray\n                | var_namedata_var_list : data_var\n                     | data_var_list COMMA data_varconstruct : PARALLEL LOOP clause_list\n                 | PARALLEL LOOP construct : PARALLEL clause_list\n                 | PARALLEL construct : KERNELS LOOP clause_list\n                 | KERNELS LOOP construct : KERNELS clause_list\n                 | KERNELS construct : LOOP clause_list\n                 | LOOP construct : DATA clause_list\n                 | construct : ENTER DATA clause_listconstruct : EXIT DATA clause_listconstruct : UPDATE clause_listclause : NUM_WORKERS LPAREN INT RPARENclause : VECTOR LPAREN INT RPAREN\n              | VECTORclause : COLLAPSE LPAREN INT RPARENclause : INDEPENDENTclause : REDUCTION LPAREN SUM COLON var_list RPAREN\n              | REDUCTION LPAREN MUL COLON var_list RPAREN\n              | REDUCTION LPAREN MAX COLON var_list RPAREN\n              | REDUCTION LPAREN MIN COLON var_list RPAREN\n              | REDUCTION LPAREN BITWISE_AND COLON var_list RPAREN\n              | REDUCTION LPAREN BITWISE_OR COLON var_list RPAREN\n              | REDUCTION LPAREN AND COLON var_list RPAREN\n              | REDUCTION LPAREN OR COLON var_list RPAREN\n              | REDUCTION LPAREN MODULE COLON var_list RPAREN clause : COPY LPAREN data_var_list RPARENclause : COPYIN LPAREN data_var_list RPARENclause : COPYOUT LPAREN data_var_list RPARENclause : CREATE LPAREN data_var_list RPARENclause : DELETE LPAREN data_var_list RPARENclause : HOST LPAREN data_var_list RPARENclause : DEVICE LPAREN data_var_list RPARENclause : GANGclause : WORKER LPAREN INT RPAREN\n              | WORKER'
+    
+_lr_action_items = {'BPRAGMA':([0,2,3,4,5,10,12,19,20,71,72,73,81,],[-4,-19,-2,-3,6,-5,-18,-26,-27,-16,-17,-6,-15,]),'NEWLINE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,],[-4,-19,-2,-3,10,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,73,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,]),'OTHER':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,13,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,74,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,-75,-75,220,220,-69,-70,-71,-72,-73,-74,]),'INT':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,109,110,111,120,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,14,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,75,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,125,126,127,172,-75,-75,221,221,-69,-70,-71,-72,-73,-74,]),'SPACE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,19,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,19,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,-75,-75,19,19,-69,-70,-71,-72,-73,-74,]),'TAB':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,20,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,20,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,-75,-75,20,20,-69,-70,-71,-72,-73,-74,]),'ACC':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,7,59,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,7,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,-75,-75,7,7,143,-69,-70,-71,-72,-73,-74,]),'SCOP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,8,60,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,8,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,-75,-75,8,8,144,-69,-70,-71,-72,-73,-74,]),'ENDSCOP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,9,61,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,9,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,-75,-75,9,9,145,-69,-70,-71,-72,-73,-74,]),'PARALLEL':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,21,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,64,21,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,-75,-75,21,21,146,-69,-70,-71,-72,-73,-74,]),'KERNELS':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,22,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,66,22,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,-75,-75,22,22,147,-69,-70,-71,-72,-73,-74,]),'LOOP':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,64,66,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,23,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,65,23,82,100,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,-75,-75,23,23,148,-69,-70,-71,-72,-73,-74,]),'NUM_WORKERS':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,24,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,24,85,85,85,85,85,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,85,-77,-103,-132,-134,-151,-153,-77,85,-77,-77,85,85,-77,-77,85,-76,149,149,149,149,149,149,149,-77,-77,-77,-104,-130,-131,-133,149,149,149,149,149,149,149,149,149,-144,149,-75,-75,-145,-146,-147,-148,-149,-150,-152,24,24,-135,149,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'VECTOR':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,25,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,25,86,86,86,86,86,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,86,-77,-103,-132,-134,-151,-153,-77,86,-77,-77,86,86,-77,-77,86,-76,150,150,150,150,150,150,150,-77,-77,-77,-104,-130,-131,-133,150,150,150,150,150,150,150,150,150,-144,150,-75,-75,-145,-146,-147,-148,-149,-150,-152,25,25,-135,150,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'COLLAPSE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,26,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,26,87,87,87,87,87,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,87,-77,-103,-132,-134,-151,-153,-77,87,-77,-77,87,87,-77,-77,87,-76,151,151,151,151,151,151,151,-77,-77,-77,-104,-130,-131,-133,151,151,151,151,151,151,151,151,151,-144,151,-75,-75,-145,-146,-147,-148,-149,-150,-152,26,26,-135,151,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'REDUCTION':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,27,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,27,89,89,89,89,89,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,89,-77,-103,-132,-134,-151,-153,-77,89,-77,-77,89,89,-77,-77,89,-76,152,152,152,152,152,152,152,-77,-77,-77,-104,-130,-131,-133,152,152,152,152,152,152,152,152,152,-144,152,-75,-75,-145,-146,-147,-148,-149,-150,-152,27,27,-135,152,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'INDEPENDENT':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,28,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,28,88,88,88,88,88,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,88,-77,-103,-132,-134,-151,-153,-77,88,-77,-77,88,88,-77,-77,88,-76,153,153,153,153,153,153,153,-77,-77,-77,-104,-130,-131,-133,153,153,153,153,153,153,153,153,153,-144,153,-75,-75,-145,-146,-147,-148,-149,-150,-152,28,28,-135,153,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'COPY':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,29,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,29,90,90,90,90,90,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,90,-77,-103,-132,-134,-151,-153,-77,90,-77,-77,90,90,-77,-77,90,-76,137,137,137,137,137,137,137,-77,-77,-77,-104,-130,-131,-133,137,137,137,137,137,137,137,137,137,-144,137,-75,-75,-145,-146,-147,-148,-149,-150,-152,29,29,-135,137,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'COPYIN':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,30,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,30,91,91,91,91,91,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,91,-77,-103,-132,-134,-151,-153,-77,91,-77,-77,91,91,-77,-77,91,-76,154,154,154,154,154,154,154,-77,-77,-77,-104,-130,-131,-133,154,154,154,154,154,154,154,154,154,-144,154,-75,-75,-145,-146,-147,-148,-149,-150,-152,30,30,-135,154,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'COPYOUT':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,31,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,31,92,92,92,92,92,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,92,-77,-103,-132,-134,-151,-153,-77,92,-77,-77,92,92,-77,-77,92,-76,155,155,155,155,155,155,155,-77,-77,-77,-104,-130,-131,-133,155,155,155,155,155,155,155,155,155,-144,155,-75,-75,-145,-146,-147,-148,-149,-150,-152,31,31,-135,155,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'CREATE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,32,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,32,93,93,93,93,93,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,93,-77,-103,-132,-134,-151,-153,-77,93,-77,-77,93,93,-77,-77,93,-76,156,156,156,156,156,156,156,-77,-77,-77,-104,-130,-131,-133,156,156,156,156,156,156,156,156,156,-144,156,-75,-75,-145,-146,-147,-148,-149,-150,-152,32,32,-135,156,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'GANG':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,33,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,33,97,97,97,97,97,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,97,-77,-103,-132,-134,-151,-153,-77,97,-77,-77,97,97,-77,-77,97,-76,157,157,157,157,157,157,157,-77,-77,-77,-104,-130,-131,-133,157,157,157,157,157,157,157,157,157,-144,157,-75,-75,-145,-146,-147,-148,-149,-150,-152,33,33,-135,157,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'WORKER':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,34,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,34,98,98,98,98,98,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,98,-77,-103,-132,-134,-151,-153,-77,98,-77,-77,98,98,-77,-77,98,-76,158,158,158,158,158,158,158,-77,-77,-77,-104,-130,-131,-133,158,158,158,158,158,158,158,158,158,-144,158,-75,-75,-145,-146,-147,-148,-149,-150,-152,34,34,-135,158,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'DATA':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,68,69,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,35,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,67,35,103,104,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,-75,-75,35,35,159,-69,-70,-71,-72,-73,-74,]),'ENTER':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,36,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,68,36,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,-75,-75,36,36,160,-69,-70,-71,-72,-73,-74,]),'EXIT':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,37,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,69,37,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,-75,-75,37,37,161,-69,-70,-71,-72,-73,-74,]),'UPDATE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,38,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,70,38,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,-75,-75,38,38,162,-69,-70,-71,-72,-73,-74,]),'DELETE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,39,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,39,94,94,94,94,94,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,94,-77,-103,-132,-134,-151,-153,-77,94,-77,-77,94,94,-77,-77,94,-76,163,163,163,163,163,163,163,-77,-77,-77,-104,-130,-131,-133,163,163,163,163,163,163,163,163,163,-144,163,-75,-75,-145,-146,-147,-148,-149,-150,-152,39,39,-135,163,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'HOST':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,40,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,40,95,95,95,95,95,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,95,-77,-103,-132,-134,-151,-153,-77,95,-77,-77,95,95,-77,-77,95,-76,164,164,164,164,164,164,164,-77,-77,-77,-104,-130,-131,-133,164,164,164,164,164,164,164,164,164,-144,164,-75,-75,-145,-146,-147,-148,-149,-150,-152,40,40,-135,164,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'DEVICE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,64,65,66,67,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,88,97,98,99,100,101,102,103,104,105,106,107,108,113,114,115,116,117,118,119,121,122,123,124,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,208,209,210,211,212,213,214,215,216,217,218,220,221,222,223,224,225,],[-4,-19,-2,-3,41,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,41,96,96,96,96,96,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,96,-77,-103,-132,-134,-151,-153,-77,96,-77,-77,96,96,-77,-77,96,-76,165,165,165,165,165,165,165,-77,-77,-77,-104,-130,-131,-133,165,165,165,165,165,165,165,165,165,-144,165,-75,-75,-145,-146,-147,-148,-149,-150,-152,41,41,-135,165,-136,-137,-138,-139,-140,-141,-142,-143,-69,-70,-71,-72,-73,-74,]),'ID':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,187,188,207,208,210,220,221,222,223,224,225,],[-4,-19,-2,-3,42,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,42,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,-75,-75,42,42,142,-69,-70,-71,-72,-73,-74,]),'LPAREN':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,85,86,87,89,90,91,92,93,94,95,96,98,],[-4,-19,-2,-3,43,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,43,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,109,110,111,112,113,114,115,116,117,118,119,120,]),'RPAREN':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,125,126,127,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,196,197,198,199,200,201,202,203,204,205,206,219,226,227,],[-4,-19,-2,-3,44,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,44,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,173,174,175,-90,185,-113,-111,-112,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,189,190,191,192,193,194,195,209,-105,211,212,213,214,215,216,217,218,-114,-110,-109,-106,]),'RBRACKET':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,45,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,45,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,-75,-75,219,226,-69,-70,-71,-72,-73,-74,]),'LBRACKET':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,137,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,219,226,],[-4,-19,-2,-3,46,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,46,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,-90,187,188,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-110,-109,]),'BACKSLASH':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,],[-4,-19,-2,-3,47,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,47,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,]),'SUM':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,48,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,48,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,128,-75,-75,48,48,-69,-70,-71,-72,-73,-74,]),'MUL':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,49,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,49,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,129,-75,-75,49,49,-69,-70,-71,-72,-73,-74,]),'MAX':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,50,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,50,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,130,-75,-75,50,50,-69,-70,-71,-72,-73,-74,]),'MIN':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,51,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,51,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,131,-75,-75,51,51,-69,-70,-71,-72,-73,-74,]),'BITWISE_AND':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,52,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,52,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,132,-75,-75,52,52,-69,-70,-71,-72,-73,-74,]),'BITWISE_OR':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,53,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,53,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,133,-75,-75,53,53,-69,-70,-71,-72,-73,-74,]),'AND':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,54,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,54,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,134,-75,-75,54,54,-69,-70,-71,-72,-73,-74,]),'OR':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,55,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,55,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,135,-75,-75,55,55,-69,-70,-71,-72,-73,-74,]),'MODULE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,112,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,56,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,56,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,136,-75,-75,56,56,-69,-70,-71,-72,-73,-74,]),'COLON':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,128,129,130,131,132,133,134,135,136,187,188,207,208,220,221,222,223,224,225,],[-4,-19,-2,-3,57,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,57,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,176,177,178,179,180,181,182,183,184,-75,-75,57,57,-69,-70,-71,-72,-73,-74,]),'COMMA':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,62,71,72,73,74,75,76,77,78,79,80,81,83,84,86,88,97,98,99,101,102,105,106,121,122,123,124,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,185,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,],[-4,-19,-2,-3,58,-28,-29,-30,-5,-14,-18,-20,-21,-22,-23,-24,-25,-26,-27,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-64,-65,-66,-67,-68,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,58,-16,-17,-6,-7,-8,-9,-10,-11,-12,-13,-15,108,-103,-132,-134,-151,-153,108,108,108,108,108,108,108,108,-104,-90,186,-113,-111,-112,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,186,186,186,186,186,186,-130,-131,-133,-144,-75,-75,-145,-146,-147,-148,-149,-150,-152,210,-105,210,210,210,210,210,210,210,210,-114,58,58,-135,-136,-137,-138,-139,-140,-141,-142,-143,-110,-69,-70,-71,-72,-73,-74,-109,-106,]),'$end':([0,1,2,3,4,10,71,72,73,81,],[-4,0,-1,-2,-3,-5,-16,-17,-6,-15,]),'EPRAGMA':([59,60,61,63,64,65,66,82,83,84,86,88,97,98,99,100,101,102,105,106,121,122,123,124,173,174,175,185,189,190,191,192,193,194,195,209,211,212,213,214,215,216,217,218,],[-126,71,72,81,-118,-124,-122,-116,-117,-103,-132,-134,-151,-153,-123,-120,-121,-125,-129,-115,-119,-127,-128,-104,-130,-131,-133,-144,-145,-146,-147,-148,-149,-150,-152,-135,-136,-137,-138,-139,-140,-141,-142,-143,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'lines':([0,],[2,]),'pragma':([2,],[3,]),'ignored_line':([2,],[4,]),'spaces':([2,],[5,]),'solid':([5,],[11,]),'whitespace':([5,62,207,208,],[12,78,223,223,]),'word':([5,62,207,208,],[15,76,222,222,]),'other_mark':([5,62,],[16,77,]),'operator':([5,62,207,208,],[17,79,224,224,]),'ponctuation':([5,62,207,208,],[18,80,225,225,]),'anything':([11,],[62,]),'construct':([59,],[63,]),'clause_list':([64,65,66,67,70,82,100,103,104,],[83,99,101,102,105,106,121,122,123,]),'clause':([64,65,66,67,70,82,100,103,104,107,],[84,84,84,84,84,84,84,84,84,124,]),'possible_comma':([83,99,101,102,105,106,121,122,123,],[107,107,107,107,107,107,107,107,107,]),'data_var_list':([113,114,115,116,117,118,119,],[138,166,167,168,169,170,171,]),'data_var':([113,114,115,116,117,118,119,186,],[139,139,139,139,139,139,139,206,]),'subarray':([113,114,115,116,117,118,119,186,],[140,140,140,140,140,140,140,140,]),'var_name':([113,114,115,116,117,118,119,176,177,178,179,180,181,182,183,184,186,210,],[141,141,141,141,141,141,141,197,197,197,197,197,197,197,197,197,141,227,]),'var_list':([176,177,178,179,180,181,182,183,184,],[196,198,199,200,201,202,203,204,205,]),'between_other_marks':([187,188,],[207,208,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> lines','program',1,'p_program','parser.py',39),
+  ('lines -> lines pragma','lines',2,'p_lines_praga','parser.py',52),
+  ('lines -> lines ignored_line','lines',2,'p_lines_ignored_line','parser.py',58),
+  ('lines -> <empty>','lines',0,'p_lines_ignored_line','parser.py',59),
+  ('ignored_line -> spaces NEWLINE','ignored_line',2,'p_ignored_line','parser.py',69),
+  ('ignored_line -> spaces solid anything NEWLINE','ignored_line',4,'p_ignored_line','parser.py',70),
+  ('anything -> anything OTHER','anything',2,'p_anything','parser.py',78),
+  ('anything -> anything INT','anything',2,'p_anything','parser.py',79),
+  ('anything -> anything word','anything',2,'p_anything','parser.py',80),
+  ('anything -> anything other_mark','anything',2,'p_anything','parser.py',81),
+  ('anything -> anything whitespace','anything',2,'p_anything','parser.py',82),
+  ('anything -> anything operator','anything',2,'p_anything','parser.py',83),
+  ('anything -> anything ponctuation','anything',2,'p_anything','parser.py',84),
+  ('anything -> <empty>','anything',0,'p_anything','parser.py',85),
+  ('pragma -> spaces BPRAGMA ACC construct EPRAGMA','pragma',5,'p_pragma','parser.py',94),
+  ('pragma -> spaces BPRAGMA SCOP EPRAGMA','pragma',4,'p_pragma_scop','parser.py',98),
+  ('pragma -> spaces BPRAGMA ENDSCOP EPRAGMA','pragma',4,'p_pragma_endscop','parser.py',102),
+  ('spaces -> spaces whitespace','spaces',2,'p_spaces','parser.py',109),
+  ('spaces -> <empty>','spaces',0,'p_spaces','parser.py',110),
+  ('solid -> OTHER','solid',1,'p_solid','parser.py',119),
+  ('solid -> INT','solid',1,'p_solid','parser.py',120),
+  ('solid -> word','solid',1,'p_solid','parser.py',121),
+  ('solid -> other_mark','solid',1,'p_solid','parser.py',122),
+  ('solid -> operator','solid',1,'p_solid','parser.py',123),
+  ('solid -> ponctuation','solid',1,'p_solid','parser.py',124),
+  ('whitespace -> SPACE','whitespace',1,'p_whitespace','parser.py',128),
+  ('whitespace -> TAB','whitespace',1,'p_whitespace','parser.py',129),
+  ('word -> ACC','word',1,'p_word','parser.py',134),
+  ('word -> SCOP','word',1,'p_word','parser.py',135),
+  ('word -> ENDSCOP','word',1,'p_word','parser.py',136),
+  ('word -> PARALLEL','word',1,'p_word','parser.py',137),
+  ('word -> KERNELS','word',1,'p_word','parser.py',138),
+  ('word -> LOOP','word',1,'p_word','parser.py',139),
+  ('word -> NUM_WORKERS','word',1,'p_word','parser.py',140),
+  ('word -> VECTOR','word',1,'p_word','parser.py',141),
+  ('word -> COLLAPSE','word',1,'p_word','parser.py',142),
+  ('word -> REDUCTION','word',1,'p_word','parser.py',143),
+  ('word -> INDEPENDENT','word',1,'p_word','parser.py',144),
+  ('word -> COPY','word',1,'p_word','parser.py',145),
+  ('word -> COPYIN','word',1,'p_word','parser.py',146),
+  ('word -> COPYOUT','word',1,'p_word','parser.py',147),
+  ('word -> CREATE','word',1,'p_word','parser.py',148),
+  ('word -> GANG','word',1,'p_word','parser.py',149),
+  ('word -> WORKER','word',1,'p_word','parser.py',150),
+  ('word -> DATA','word',1,'p_word','parser.py',151),
+  ('word -> ENTER','word',1,'p_word','parser.py',152),
+  ('word -> EXIT','word',1,'p_word','parser.py',153),
+  ('word -> UPDATE','word',1,'p_word','parser.py',154),
+  ('word -> DELETE','word',1,'p_word','parser.py',155),
+  ('word -> HOST','word',1,'p_word','parser.py',156),
+  ('word -> DEVICE','word',1,'p_word','parser.py',157),
+  ('word -> ID','word',1,'p_word','parser.py',158),
+  ('operator -> SUM','operator',1,'p_operator','parser.py',163),
+  ('operator -> MUL','operator',1,'p_operator','parser.py',164),
+  ('operator -> MAX','operator',1,'p_operator','parser.py',165),
+  ('operator -> MIN','operator',1,'p_operator','parser.py',166),
+  ('operator -> BITWISE_AND','operator',1,'p_operator','parser.py',167),
+  ('operator -> BITWISE_OR','operator',1,'p_operator','parser.py',168),
+  ('operator -> AND','operator',1,'p_operator','parser.py',169),
+  ('operator -> OR','operator',1,'p_operator','parser.py',170),
+  ('operator -> MODULE','operator',1,'p_operator','parser.py',171),
+  ('ponctuation -> COLON','ponctuation',1,'p_ponctuation','parser.py',176),
+  ('ponctuation -> COMMA','ponctuation',1,'p_ponctuation','parser.py',177),
+  ('other_mark -> LPAREN','other_mark',1,'p_other_mark','parser.py',182),
+  ('other_mark -> RPAREN','other_mark',1,'p_other_mark','parser.py',183),
+  ('other_mark -> RBRACKET','other_mark',1,'p_other_mark','parser.py',184),
+  ('other_mark -> LBRACKET','other_mark',1,'p_other_mark','parser.py',185),
+  ('other_mark -> BACKSLASH','other_mark',1,'p_other_mark','parser.py',186),
+  ('between_other_marks -> between_other_marks OTHER','between_other_marks',2,'p_between_other_mark','parser.py',191),
+  ('between_other_marks -> between_other_marks INT','between_other_marks',2,'p_between_other_mark','parser.py',192),
+  ('between_other_marks -> between_other_marks word','between_other_marks',2,'p_between_other_mark','parser.py',193),
+  ('between_other_marks -> between_other_marks whitespace','between_other_marks',2,'p_between_other_mark','parser.py',194),
+  ('between_other_marks -> between_other_marks operator','between_other_marks',2,'p_between_other_mark','parser.py',195),
+  ('between_other_marks -> between_other_marks ponctuation','between_other_marks',2,'p_between_other_mark','parser.py',196),
+  ('between_other_marks -> <empty>','between_other_marks',0,'p_between_other_mark','parser.py',197),
+  ('possible_comma -> COMMA','possible_comma',1,'p_possible_comma','parser.py',205),
+  ('possible_comma -> <empty>','possible_comma',0,'p_possible_comma','parser.py',206),
+  ('var_name -> ID','var_name',1,'p_varname','parser.py',213),
+  ('var_name -> ACC','var_name',1,'p_varname','parser.py',214),
+  ('var_name -> SCOP','var_name',1,'p_varname','parser.py',215),
+  ('var_name -> ENDSCOP','var_name',1,'p_varname','parser.py',216),
+  ('var_name -> PARALLEL','var_name',1,'p_varname','parser.py',217),
+  ('var_name -> KERNELS','var_name',1,'p_varname','parser.py',218),
+  ('var_name -> LOOP','var_name',1,'p_varname','parser.py',219),
+  ('var_name -> NUM_WORKERS','var_name',1,'p_varname','parser.py',220),
+  ('var_name -> VECTOR','var_name',1,'p_varname','parser.py',221),
+  ('var_name -> COLLAPSE','var_name',1,'p_varname','parser.py',222),
+  ('var_name -> REDUCTION','var_name',1,'p_varname','parser.py',223),
+  ('var_name -> INDEPENDENT','var_name',1,'p_varname','parser.py',224),
+  ('var_name -> COPY','var_name',1,'p_varname','parser.py',225),
+  ('var_name -> COPYIN','var_name',1,'p_varname','parser.py',226),
+  ('var_name -> COPYOUT','var_name',1,'p_varname','parser.py',227),
+  ('var_name -> CREATE','var_name',1,'p_varname','parser.py',228),
+  ('var_name -> GANG','var_name',1,'p_varname','parser.py',229),
+  ('var_name -> WORKER','var_name',1,'p_varname','parser.py',230),
+  ('var_name -> DATA','var_name',1,'p_varname','parser.py',231),
+  ('var_name -> ENTER','var_name',1,'p_varname','parser.py',232),
+  ('var_name -> EXIT','var_name',1,'p_varname','parser.py',233),
+  ('var_name -> UPDATE','var_name',1,'p_varname','parser.py',234),
+  ('var_name -> DELETE','var_name',1,'p_varname','parser.py',235),
+  ('var_name -> HOST','var_name',1,'p_varname','parser.py',236),
+  ('var_name -> DEVICE','var_name',1,'p_varname','parser.py',237),
+  ('clause_list -> clause','clause_list',1,'p_clause_list','parser.py',242),
+  ('clause_list -> clause_list possible_comma clause','clause_list',3,'p_clause_list','parser.py',243),
+  ('var_list -> var_name','var_list',1,'p_var_list','parser.py',252),
+  ('var_list -> var_list COMMA var_name','var_list',3,'p_var_list','parser.py',253),
+  ('value -> var_name','value',1,'p_value','parser.py',262),
+  ('value -> INT','value',1,'p_value','parser.py',263),
+  ('subarray -> var_name LBRACKET between_other_marks RBRACKET','subarray',4,'p_subarray','parser.py',268),
+  ('subarray -> subarray LBRACKET between_other_marks RBRACKET','subarray',4,'p_subarray','parser.py',269),
+  ('data_var -> subarray','data_var',1,'p_data_var','parser.py',278),
+  ('data_var -> var_name','data_var',1,'p_data_var','parser.py',279),
+  ('data_var_list -> data_var','data_var_list',1,'p_data_var_list','parser.py',287),
+  ('data_var_list -> data_var_list COMMA data_var','data_var_list',3,'p_data_var_list','parser.py',288),
+  ('construct -> PARALLEL LOOP clause_list','construct',3,'p_construct_parallel_loop','parser.py',299),
+  ('construct -> PARALLEL LOOP','construct',2,'p_construct_parallel_loop','parser.py',300),
+  ('construct -> PARALLEL clause_list','construct',2,'p_construct_parallel','parser.py',308),
+  ('construct -> PARALLEL','construct',1,'p_construct_parallel','parser.py',309),
+  ('construct -> KERNELS LOOP clause_list','construct',3,'p_construct_kernels_loop','parser.py',317),
+  ('construct -> KERNELS LOOP','construct',2,'p_construct_kernels_loop','parser.py',318),
+  ('construct -> KERNELS clause_list','construct',2,'p_construct_kernels','parser.py',326),
+  ('construct -> KERNELS','construct',1,'p_construct_kernels','parser.py',327),
+  ('construct -> LOOP clause_list','construct',2,'p_construct_loop','parser.py',335),
+  ('construct -> LOOP','construct',1,'p_construct_loop','parser.py',336),
+  ('construct -> DATA clause_list','construct',2,'p_construct_data','parser.py',345),
+  ('construct -> <empty>','construct',0,'p_construct_data','parser.py',346),
+  ('construct -> ENTER DATA clause_list','construct',3,'p_construct_enter_data','parser.py',354),
+  ('construct -> EXIT DATA clause_list','construct',3,'p_construct_exit_data','parser.py',359),
+  ('construct -> UPDATE clause_list','construct',2,'p_construct_update','parser.py',364),
+  ('clause -> NUM_WORKERS LPAREN INT RPAREN','clause',4,'p_clause_num_workers','parser.py',371),
+  ('clause -> VECTOR LPAREN INT RPAREN','clause',4,'p_clause_vector','parser.py',376),
+  ('clause -> VECTOR','clause',1,'p_clause_vector','parser.py',377),
+  ('clause -> COLLAPSE LPAREN INT RPAREN','clause',4,'p_clause_collapse','parser.py',385),
+  ('clause -> INDEPENDENT','clause',1,'p_clause_independent','parser.py',390),
+  ('clause -> REDUCTION LPAREN SUM COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',395),
+  ('clause -> REDUCTION LPAREN MUL COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',396),
+  ('clause -> REDUCTION LPAREN MAX COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',397),
+  ('clause -> REDUCTION LPAREN MIN COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',398),
+  ('clause -> REDUCTION LPAREN BITWISE_AND COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',399),
+  ('clause -> REDUCTION LPAREN BITWISE_OR COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',400),
+  ('clause -> REDUCTION LPAREN AND COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',401),
+  ('clause -> REDUCTION LPAREN OR COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',402),
+  ('clause -> REDUCTION LPAREN MODULE COLON var_list RPAREN','clause',6,'p_clause_reduction','parser.py',403),
+  ('clause -> COPY LPAREN data_var_list RPAREN','clause',4,'p_clause_copy','parser.py',408),
+  ('clause -> COPYIN LPAREN data_var_list RPAREN','clause',4,'p_clause_copyin','parser.py',413),
+  ('clause -> COPYOUT LPAREN data_var_list RPAREN','clause',4,'p_clause_copyout','parser.py',418),
+  ('clause -> CREATE LPAREN data_var_list RPAREN','clause',4,'p_clause_create','parser.py',423),
+  ('clause -> DELETE LPAREN data_var_list RPAREN','clause',4,'p_clause_delete','parser.py',428),
+  ('clause -> HOST LPAREN data_var_list RPAREN','clause',4,'p_clause_host','parser.py',433),
+  ('clause -> DEVICE LPAREN data_var_list RPAREN','clause',4,'p_clause_device','parser.py',438),
+  ('clause -> GANG','clause',1,'p_clause_gang','parser.py',443),
+  ('clause -> WORKER LPAREN INT RPAREN','clause',4,'p_clause_worker','parser.py',448),
+  ('clause -> WORKER','clause',1,'p_clause_worker','parser.py',449),
+]
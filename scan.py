@@ -0,0 +1,135 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Inventory of the OpenACC pragmas of source trees, written as JSON lines
+# without translating anything
+# -----------------------------------------------------------------------------
+
+import concurrent.futures
+import json
+import mmap
+import os
+import re
+import sys
+import time
+
+import batch
+import emitter
+import parser
+
+# Matches the beginning of an OpenACC pragma, as the lexer reads it. The
+# file is searched with it alone, which is much faster than finding every
+# pragma, and the lines before a match are only checked to be white spaces
+_acc_pragma = re.compile(br'\#[ ]*pragma[\s\\]+acc\b')
+
+# Names of the clauses whose variables are data variables
+_data_clauses = frozenset(name for name, kind in
+                          emitter.DATA_MAPS + emitter.EXIT_MAPS +
+                          emitter.UPDATE_MOTIONS)
+
+# Return: Dictionary describing the Clause 'clause', with only the fields it
+# uses
+def _clause_record(clause):
+    record = {'name': clause.name}
+    if clause.value is not None:
+        record['value'] = clause.value
+    if clause.operator is not None:
+        record['operator'] = clause.operator
+    if clause.variables:
+        record['variables'] = [str(variable) for variable in clause.variables]
+    return record
+
+# Return: Dictionary describing the OpenACC pragma 'text' found at line
+# 'lineno' of the file 'filename': its construct, its clauses and the
+# variables of its data clauses. A pragma that cannot be parsed has a None
+# construct and the message of the error
+def pragma_record(text, filename, lineno):
+    record = {'file': filename, 'line': lineno}
+    try:
+        directive = parser.parse_pragma(text).directive
+    except SyntaxError as e:
+        record.update(construct=None, pragma=text.rstrip('\n'), error=str(e))
+        return record
+    record['construct'] = directive.construct
+    record['clauses'] = [_clause_record(clause)
+                         for clause in directive.clauses]
+    record['variables'] = [str(variable)
+                           for clause in directive.clauses
+                           if clause.name in _data_clauses
+                           for variable in clause.variables]
+    return record
+
+# Return: List of the records of the OpenACC pragmas of the file 'src', in
+# the order they are found. The file is mapped in memory and only the
+# OpenACC pragmas are lexed and parsed
+def scan_file(src):
+    parser.get_parser()
+    records = []
+    with open(src, 'rb') as input_file:
+        # An empty file cannot be mapped
+        if os.fstat(input_file.fileno()).st_size == 0:
+            return records
+        with mmap.mmap(input_file.fileno(), 0,
+                       access=mmap.ACCESS_READ) as data:
+            pos = 0
+            lineno = 1
+            for match in _acc_pragma.finditer(data):
+                start = data.rfind(b'\n', pos, match.start()) + 1 or pos
+                # Inside a pragma already scanned or after other text
+                if match.start() < pos or data[start:match.start()].strip():
+                    continue
+                lineno += data[pos:start].count(b'\n')
+                end = parser._pragma_end(data, start)
+                pragma = data[start:end]
+                text = pragma.decode(parser.MMAP_ENCODING, 'surrogateescape')
+                records.append(pragma_record(text, src, lineno))
+                lineno += pragma.count(b'\n')
+                pos = end
+    return records
+
+# Return: Tuple with the file 'src', its size, its list of records and the
+# error message, None when it could be read
+def _scan_one(src):
+    try:
+        return src, os.path.getsize(src), scan_file(src), None
+    except OSError as e:
+        return src, 0, [], str(e)
+
+# Write the records of the OpenACC pragmas of the files found in 'paths',
+# as batch.find_sources finds them, to the file object 'out', one JSON
+# object per line. The files are scanned on 'jobs' processes, by default
+# one per CPU, and their records are written in the order of the files. A
+# summary is written to the file object 'log'.
+# Return: Number of files that could not be read
+def scan_tree(paths, jobs=None, out=sys.stdout, log=sys.stderr):
+    sources = [src for src, relative in batch.find_sources(paths)]
+    start = time.perf_counter()
+    parser.get_parser()
+    failures = 0
+    total = 0
+    pragmas = 0
+    if jobs == 1 or len(sources) == 1:
+        results = map(_scan_one, sources)
+        executor = None
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=parser.get_parser)
+        results = executor.map(_scan_one, sources, chunksize=16)
+    try:
+        for src, size, records, error in results:
+            total += size
+            pragmas += len(records)
+            for record in records:
+                out.write(json.dumps(record) + "\n")
+            if error is not None:
+                failures += 1
+                log.write("  FAILED %s: %s\n" % (src, error))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start
+    log.write("%d pragmas in %d files (%d failed), %.1f MB in %.3fs: "
+              "%.1f MB/s\n" % (pragmas, len(sources), failures, total / 1e6,
+                               elapsed,
+                               total / 1e6 / elapsed if elapsed else 0.0))
+    return failures
@@ -0,0 +1,114 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Output sinks the translations are written to
+# -----------------------------------------------------------------------------
+
+# Number of characters, or bytes, gathered before they are written at once
+BUFFER_SIZE = 1 << 16
+
+# Destination of a translation, fed piece by piece. The small pieces are
+# gathered and written together, the pieces of at least 'buffer_size' are
+# written as they are, so a large memoryview is not copied. The pieces are
+# all strings or all bytes-like objects
+class OutputSink(object):
+
+    def __init__(self, buffer_size=BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.pieces = []
+        self.buffered = 0
+
+    def write(self, data):
+        size = len(data)
+        if size >= self.buffer_size:
+            self.flush()
+            self._write(data)
+            return
+        # A memoryview kept in the buffer would hold its exporter, the small
+        # ones are copied
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        self.pieces.append(data)
+        self.buffered += size
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    # Write the gathered pieces
+    def flush(self):
+        if self.pieces:
+            if isinstance(self.pieces[0], str):
+                self._write("".join(self.pieces))
+            else:
+                self._write(b"".join(self.pieces))
+            self.pieces = []
+            self.buffered = 0
+
+    # Write the gathered pieces and release the destination
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Write 'data' to the destination
+    def _write(self, data):
+        raise NotImplementedError
+
+# Sink writing to the file 'path', as text encoded with 'encoding' and
+# 'errors' as open does or, when 'binary' is true, as bytes. The file is
+# closed with the sink
+class FileSink(OutputSink):
+
+    def __init__(self, path, binary=False, buffer_size=BUFFER_SIZE,
+                 encoding=None, errors=None):
+        OutputSink.__init__(self, buffer_size)
+        if binary:
+            self.file = open(path, 'wb')
+        else:
+            self.file = open(path, 'w', encoding=encoding, errors=errors)
+
+    def _write(self, data):
+        self.file.write(data)
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.file.close()
+
+# Sink writing to the file object 'stream', for instance sys.stdout, which
+# is flushed but left open by the sink
+class StreamSink(OutputSink):
+
+    def __init__(self, stream, buffer_size=BUFFER_SIZE):
+        OutputSink.__init__(self, buffer_size)
+        self.stream = stream
+
+    def _write(self, data):
+        self.stream.write(data)
+
+    def close(self):
+        self.flush()
+        self.stream.flush()
+
+# Sink keeping the translation in memory
+class BufferSink(OutputSink):
+
+    def __init__(self):
+        OutputSink.__init__(self)
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(data)
+
+    def flush(self):
+        pass
+
+    # Return: String, or bytes, with everything written so far
+    def getvalue(self):
+        if self.parts and not isinstance(self.parts[0], str):
+            return b"".join(self.parts)
+        return "".join(self.parts)
@@ -0,0 +1,142 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Timing and counters of the translations
+# -----------------------------------------------------------------------------
+
+import time
+
+from ir import Pragma
+
+# The lexer is timed on one token in LEX_SAMPLE, which stands for the time of
+# the LEX_SAMPLE tokens, so timing it costs little of the translation
+LEX_SAMPLE = 16
+
+# Constructs counted without the 'acc' prefix of the OpenACC constructs
+MARKERS = ('scop', 'endscop')
+
+# Time spent in each phase of the translations and counters of what they
+# found. The lexing and parsing are timed around the parser, the writing
+# around the output and the scanning for pragmas is the remaining time. The
+# sizes are in characters for text input and in bytes for memory-mapped input
+class TranslationStats(object):
+
+    def __init__(self):
+        self.files = 0
+        self.total_time = 0.0
+        self.lex_time = 0.0
+        self.parse_time = 0.0
+        self.write_time = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.pragma_hits = 0
+        self.pragma_misses = 0
+        self.tokens = {}
+        self.constructs = {}
+        self._lexed = 0
+        self._start = None
+        self._cache_info = None
+
+    # Start timing a translation. 'cache_info' has the counters of the
+    # pragma translations kept in memory
+    def start(self, cache_info):
+        self._start = time.perf_counter()
+        self._cache_info = (cache_info.hits, cache_info.misses)
+
+    # Stop timing the translation started by start()
+    def stop(self, cache_info):
+        self.total_time += time.perf_counter() - self._start
+        hits, misses = self._cache_info
+        self.pragma_hits += cache_info.hits - hits
+        self.pragma_misses += cache_info.misses - misses
+        self._start = None
+        self._cache_info = None
+
+    # Return: Result of parsing 'text' with 'parser' and 'lexer', counting the
+    # tokens the lexer produces. The lexing time is estimated from the
+    # tokens timed, one in LEX_SAMPLE, and the remaining time is parsing
+    def parse(self, parser, text, lexer):
+        lex_time = self.lex_time
+        tokens = self.tokens
+        lexed = self._lexed
+
+        def token():
+            nonlocal lexed
+            lexed += 1
+            if lexed % LEX_SAMPLE:
+                tok = lexer.token()
+            else:
+                start = time.perf_counter()
+                tok = lexer.token()
+                self.lex_time += (time.perf_counter() - start) * LEX_SAMPLE
+            if tok is not None:
+                tokens[tok.type] = tokens.get(tok.type, 0) + 1
+            return tok
+
+        start = time.perf_counter()
+        try:
+            result = parser.parse(text, lexer=lexer, tokenfunc=token)
+        finally:
+            self._lexed = lexed
+        elapsed = time.perf_counter() - start
+        self.parse_time += max(0.0, elapsed - (self.lex_time - lex_time))
+        return result
+
+    # Return: Function calling 'write' that times it and counts what it writes
+    def timed_write(self, write):
+        def timed(data):
+            start = time.perf_counter()
+            write(data)
+            self.write_time += time.perf_counter() - start
+            self.bytes_out += len(data)
+        return timed
+
+    # Count the pragma of 'items', the list of Pragma and of strings built by
+    # the parser, under the construct of its Directive, for instance 'acc
+    # parallel loop', 'acc enter data' or 'scop'. 'items' is None for a
+    # pragma that could not be parsed, counted as 'unknown'
+    def add_pragma(self, items):
+        construct = 'unknown'
+        for item in items or ():
+            if isinstance(item, Pragma):
+                construct = item.directive.construct
+                if construct not in MARKERS:
+                    construct = 'acc ' + construct
+                break
+        self.constructs[construct] = self.constructs.get(construct, 0) + 1
+
+    # Add the counters of the TranslationStats 'other'
+    def merge(self, other):
+        for name in ('files', 'total_time', 'lex_time', 'parse_time',
+                     'write_time', 'bytes_in', 'bytes_out', 'pragma_hits',
+                     'pragma_misses'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for counters, others in ((self.tokens, other.tokens),
+                                 (self.constructs, other.constructs)):
+            for key, count in others.items():
+                counters[key] = counters.get(key, 0) + count
+
+    # Return: String with the report of the counters, one line per subject
+    def report(self):
+        scan_time = max(0.0, self.total_time - self.lex_time -
+                        self.parse_time - self.write_time)
+        pragmas = sum(self.constructs.values())
+        tokens = sum(self.tokens.values())
+        lines = [
+            "time: %.3fs total, %.3fs scan, %.3fs lex, %.3fs parse, %.3fs write"
+            % (self.total_time, scan_time, self.lex_time, self.parse_time,
+               self.write_time),
+            "size: %d in, %d out, %d files" % (self.bytes_in, self.bytes_out,
+                                               self.files),
+            "pragmas: %d (%s), %d from memory, %d parsed"
+            % (pragmas, _counts(self.constructs), self.pragma_hits,
+               self.pragma_misses),
+            "tokens: %d (%s)" % (tokens, _counts(self.tokens)),
+        ]
+        return "\n".join(lines)
+
+# Return: String with the counters of the dictionary 'counters', the largest
+# first
+def _counts(counters):
+    items = sorted(counters.items(), key=lambda item: (-item[1], item[0]))
+    return ", ".join("%s: %d" % item for item in items)
@@ -0,0 +1,11 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Test configuration: the modules of the translator are imported from the
+# root of the repository
+# -----------------------------------------------------------------------------
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,135 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Tests of the scanner of C statements and of the merging of adjacent data
+# regions
+# -----------------------------------------------------------------------------
+
+import parser
+from merge import statement_end, DataMerges
+
+# Return: Text of the statement of 'text' from 'pos' as statement_end finds
+# it, None when it finds no end
+def statement(text, pos=0, limit=None):
+    end = statement_end(text, pos, limit)
+    return None if end < 0 else text[pos:end]
+
+def test_braces_in_literals():
+    assert statement('{ s = "}"; c = \'}\'; } x;') == \
+        '{ s = "}"; c = \'}\'; }'
+    assert statement('{ s = "\\"}"; } x;') == '{ s = "\\"}"; }'
+
+def test_braces_in_comments():
+    assert statement('{ /* } */ a = 1; // }\n } x;') == \
+        '{ /* } */ a = 1; // }\n }'
+
+def test_if_else():
+    assert statement('if (a) b = 1; else { c = "{"; } x;') == \
+        'if (a) b = 1; else { c = "{"; }'
+    assert statement('if (a) b = 1;\n x = 2;') == 'if (a) b = 1;'
+    assert statement('if (a) if (b) c = 1; else d = 2; x;') == \
+        'if (a) if (b) c = 1; else d = 2;'
+
+def test_else_past_limit():
+    # The 'else' that may follow is not looked at
+    assert statement('if (a) b = 1; else c = 2;', 0, 13) is None
+    assert statement('if (a) b = 1; else c = 2;', 0, 17) is None
+
+def test_do_while():
+    assert statement('do { a++; } while (a < n); x;') == \
+        'do { a++; } while (a < n);'
+    assert statement('do a++; while (f(a, ")")); x;') == \
+        'do a++; while (f(a, ")"));'
+    assert statement('do { a++; } x;') is None
+
+def test_pragmas_inside():
+    assert statement('{\n#pragma acc loop\n for (;;) a++;\n} x;') == \
+        '{\n#pragma acc loop\n for (;;) a++;\n}'
+    assert statement('for (i = 0; i < n; i++)\n#pragma acc loop\n'
+                     ' for (j = 0; j < n; j++) a++; x;') == \
+        'for (i = 0; i < n; i++)\n#pragma acc loop\n' \
+        ' for (j = 0; j < n; j++) a++;'
+
+def test_preprocessor_inside():
+    # The preprocessor may remove the braces, the statement is not followed
+    assert statement('{\n#if X\n a = 1;\n#endif\n} x;') is None
+    assert statement('{\n#define N 4\n a = N;\n} x;') is None
+
+def test_unterminated():
+    assert statement('{ a = 1;') is None
+    assert statement('for (i = 0; i < n; i++') is None
+    assert statement('   ') is None
+
+def test_limit():
+    # A larger limit gives the same end or finds one
+    text = '{ a = "}"; /* { */ if (b) c = 1; else d = 2; } x = 1;'
+    end = statement_end(text, 0)
+    assert end == text.index('} x') + 1
+    for limit in range(len(text) + 1):
+        found = statement_end(text, 0, limit)
+        assert found in (-1, end)
+        if found == end:
+            assert statement_end(text, 0, limit + 1) == end
+
+# Return: True when the statement of the data region copying 'a' followed by
+# 'body' only runs compute constructs on data that the region maps
+def device_only(body):
+    pragma = '#pragma acc data copy(a[0:n])\n'
+    parser.get_parser()
+    return parser._device_only(pragma + body, len(pragma), {'a'})
+
+LOOP = '#pragma acc parallel loop%s\n for (i = 0; i < n; i++) a[i]++;\n'
+
+def test_device_only():
+    assert device_only('{\n' + LOOP % '' + '}\n')
+    assert device_only(LOOP % '')
+    assert device_only('{\n' + LOOP % ' copy(a[0:n])' + LOOP % '' + '}\n')
+    assert device_only('{\n' + LOOP % '' +
+                       '#pragma acc kernels\n { a[0] = 1; }\n}\n')
+
+def test_not_device_only():
+    # Host code, data the region does not map, and a construct that is not
+    # a compute one
+    assert not device_only('{\n' + LOOP % '' + ' a[0] = 1;\n}\n')
+    assert not device_only('{\n' + LOOP % ' copy(b[0:n])' + '}\n')
+    assert not device_only('{\n#pragma acc update host(a[0:n])\n}\n')
+    assert not device_only('{\n#if X\n' + LOOP % '' + '#endif\n}\n')
+
+DATA = '#pragma acc data copy(a[0:n])\n{\n' + LOOP % '' + '%s}\n'
+
+def test_merge_data_regions():
+    merges = DataMerges()
+    output = parser.translate(DATA % '' + DATA % '', merges=merges)
+    assert output.startswith('#pragma omp target data map(tofrom:a[0:n]) \n'
+                             '{\n#pragma omp target data '
+                             'map(alloc:a[0:n]) \n')
+    assert output.endswith('a[i]++;\n} }\n')
+    assert output.count('map(alloc:a[0:n])') == 2
+    assert len(merges) == 1 and merges.transfers() == 2
+
+def test_no_merge_with_host_code():
+    # The host may use the data copied back by the first region
+    merges = DataMerges()
+    output = parser.translate(DATA % ' a[0] = 1;\n' + DATA % '',
+                              merges=merges)
+    assert output.count('map(tofrom:a[0:n])') == 2
+    assert 'alloc' not in output
+    assert len(merges) == 0
+
+def test_merge_compute_constructs():
+    text = ('#pragma acc parallel loop copy(a[0:n])\n'
+            'for (i = 0; i < n; i++) a[i] *= 2;\n'
+            '#pragma acc parallel loop copyin(a[0:n]) copyout(b[0:n])\n'
+            'for (i = 0; i < n; i++) b[i] = a[i];\n'
+            'x = 1;\n')
+    merges = DataMerges()
+    output = parser.translate(text, merges=merges)
+    assert output.startswith('#pragma omp target data map(tofrom:a[0:n]) '
+                             'map(from:b[0:n]) \n{\n')
+    assert 'b[i] = a[i]; }\nx = 1;\n' in output
+    assert len(merges) == 1 and merges.transfers() == 1
+    # Not when the host runs code between them
+    merges = DataMerges()
+    output = parser.translate(text.replace('2;\n', '2;\ny = 0;\n', 1),
+                              merges=merges)
+    assert 'alloc' not in output and len(merges) == 0
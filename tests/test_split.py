@@ -0,0 +1,101 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Tests of the data regions known to the pragmas inside them, and of the
+# translations reading the input in pieces, which must all give the output of
+# the translation of the whole text
+# -----------------------------------------------------------------------------
+
+import io
+import random
+
+import pytest
+
+import batch
+import parser
+
+# Sizes small enough for the regions of a small corpus to cross the cuts
+WINDOW = 2048
+CHUNK = 8192
+
+@pytest.fixture
+def small_pieces(monkeypatch):
+    monkeypatch.setattr(parser, 'STREAM_CHUNK', 2 * WINDOW)
+    monkeypatch.setattr(parser, 'REGION_WINDOW', WINDOW)
+    monkeypatch.setattr(batch, 'PARALLEL_CHUNK', CHUNK)
+    monkeypatch.setattr(batch, 'PARALLEL_MIN_CHUNK', CHUNK)
+
+# Return: String with the statement of a data region copying 'a' holding a
+# compute construct that copies it too, with about 'size' characters of plain
+# code around the construct
+def data_region(rng, size):
+    code = []
+    while sum(map(len, code)) < size:
+        code.append(rng.choice([
+            '    a[i] = "{" [0] + b[i]; /* } */\n',
+            '    if (x) y = \'}\'; else { z = 1; } // {\n',
+            '    do { k++; } while (k < n);\n',
+            '\n',
+        ]))
+    half = len(code) // 2
+    return ('#pragma acc data copy(a[0:n]) \\\n    copyin(b[0:n])\n{\n' +
+            ''.join(code[:half]) +
+            '#pragma acc parallel loop copy(a[0:n]) \\\n    gang\n'
+            '    for (i = 0; i < n; i++) a[i] += b[i];\n' +
+            ''.join(code[half:]) + '}\n')
+
+# Return: String with a corpus of about 'size' characters of data regions of
+# all sizes, some longer than the window, plain code and compute constructs
+def corpus(size, seed=0):
+    rng = random.Random(seed)
+    parts = []
+    while sum(map(len, parts)) < size:
+        # Few regions are longer than the window, so most cuts fall in
+        # regions that the pieces know
+        parts.append(data_region(rng, 3 * WINDOW if rng.random() < 0.05
+                                 else rng.choice([64, 800, 1800])))
+        parts.append('x = 1;\n' * rng.randrange(4) +
+                     '#pragma acc parallel loop copyout(c[0:n])\n'
+                     'for (i = 0; i < n; i++) c[i] = 0;\n')
+    return ''.join(parts)
+
+def test_inner_data_allocated():
+    output = parser.translate(data_region(random.Random(0), 64))
+    assert output.startswith('#pragma omp target data map(tofrom:a[0:n]) '
+                             'map(to:b[0:n]) \n')
+    assert '#pragma omp target data map(alloc:a[0:n]) \n' in output
+
+def test_region_past_window(small_pieces):
+    # The pragma inside copies the data the region holds, the same way
+    # whatever the input is read in
+    text = data_region(random.Random(0), 2 * WINDOW)
+    output = parser.translate(text)
+    assert 'map(alloc:a[0:n])' not in output
+    assert output.count('map(tofrom:a[0:n])') == 2
+    streamed = io.StringIO()
+    parser.translate_stream(io.StringIO(text), streamed)
+    assert streamed.getvalue() == output
+
+# Return: Never, the translation of the whole file must not be needed
+def whole_file(*args):
+    raise AssertionError('file translated by a single process')
+
+def test_split_identity(small_pieces, tmp_path, monkeypatch):
+    text = corpus(16 * CHUNK)
+    src = tmp_path / 'input.c'
+    src.write_bytes(text.encode())
+    data = src.read_bytes()
+    # The pieces are not cut where the file is cut in parts
+    cuts = [data.find(b'\n', len(data) * part // 16 - 1) + 1
+            for part in range(1, 16)]
+    assert any(parser.split_point(data, cut) != cut for cut in cuts)
+    expected = parser.translate(text)
+    assert expected.count('map(alloc:a[0:n])') > 0
+    streamed = io.StringIO()
+    parser.translate_stream(io.StringIO(text), streamed)
+    assert streamed.getvalue() == expected
+    parser.translate_mmap(str(src), str(tmp_path / 'mmap.c'))
+    assert (tmp_path / 'mmap.c').read_text() == expected
+    monkeypatch.setattr(parser, 'translate_file', whole_file)
+    batch.translate_parallel(str(src), str(tmp_path / 'parallel.c'), jobs=3)
+    assert (tmp_path / 'parallel.c').read_text() == expected
@@ -0,0 +1,160 @@
+# -----------------------------------------------------------------------------
+# OpenAcc pragmas to OpenMP
+#
+# Watch mode: translate the files of source trees again when they change
+# -----------------------------------------------------------------------------
+
+import hashlib
+import os
+import sys
+import time
+
+import batch
+import parser
+
+# Seconds between two scans of the source trees
+POLL_INTERVAL = 0.5
+
+# Seconds a file must stay unchanged before it is translated, so a file
+# being written is translated once the editor is done
+DEBOUNCE = 0.3
+
+# Return: Tuple with the modification time in nanoseconds and the size of
+# the file 'path', None when it does not exist anymore
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+# Return: String with the hash of the content of the file 'path'
+def _digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as input_file:
+        for block in iter(lambda: input_file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Translations of the files found in 'paths' into 'output_dir', as
+# batch.translate_tree does, kept up to date by scanning the trees every
+# 'interval' seconds. The parser and the pragmas already seen stay in
+# memory, so only the pragmas that were edited go through the parser again.
+# When the Diagnostics 'diagnostics' is given, the pragmas that cannot be
+# translated are left as they are, recorded there and shown as they are
+# found
+class TreeWatcher(object):
+
+    def __init__(self, paths, output_dir, interval=POLL_INTERVAL,
+                 debounce=DEBOUNCE, cache=None, use_mmap=False, stats=None,
+                 out=sys.stdout, diagnostics=None):
+        self.paths = paths
+        self.output_dir = output_dir
+        self.interval = interval
+        self.debounce = debounce
+        self.cache = cache
+        self.use_mmap = use_mmap
+        self.stats = stats
+        self.out = out
+        self.diagnostics = diagnostics
+        # Source -> (stat, digest) of the input of its last translation
+        self.translated = {}
+        # Source -> (stat, time) of a change not translated yet
+        self.pending = {}
+        self.translations = 0
+        self.failures = 0
+
+    # Translate the file 'src' into 'dst' and record the state it had
+    def translate(self, src, dst, stat, digest):
+        result = batch.translate_one(src, dst, self.cache, self.use_mmap,
+                                     self.stats is not None,
+                                     self.diagnostics is not None)
+        (src, dst, size, elapsed, cached, error, file_stats,
+         file_diagnostics) = result
+        self.translated[src] = (stat, digest)
+        self.translations += 1
+        if file_stats is not None:
+            self.stats.merge(file_stats)
+        if error is None:
+            self.out.write("%8.3fs %12d B  %s -> %s%s%s\n" % (elapsed, size,
+                           src, dst, " (cached)" if cached else "",
+                           batch.untranslated_note(file_diagnostics)))
+        else:
+            self.failures += 1
+            self.out.write("  FAILED %12d B  %s: %s\n" % (size, src, error))
+        if file_diagnostics is not None:
+            self.diagnostics.merge(file_diagnostics)
+            for diagnostic in file_diagnostics:
+                self.out.write("%s\n" % diagnostic)
+        self.out.flush()
+
+    # Scan the source trees once and translate the files whose changes are
+    # older than the debounce delay. When 'initial' is true, the files whose
+    # translation is newer than the file are only recorded. ValueError is
+    # raised when two files would have the same translation path.
+    # Return: Number of files translated
+    def poll(self, initial=False):
+        now = time.monotonic()
+        count = 0
+        found = set()
+        sources = batch.find_sources(self.paths, self.output_dir)
+        batch.check_outputs(sources)
+        for src, relative in sources:
+            found.add(src)
+            stat = _stat(src)
+            if stat is None:
+                continue
+            dst = os.path.join(self.output_dir, relative)
+            if initial:
+                output = _stat(dst)
+                if output is not None and output[0] >= stat[0]:
+                    self.translated[src] = (stat, None)
+                    continue
+                self.translate(src, dst, stat, None)
+                count += 1
+                continue
+            last = self.translated.get(src)
+            if last is not None and last[0] == stat:
+                self.pending.pop(src, None)
+                continue
+            change = self.pending.get(src)
+            if change is None or change[0] != stat:
+                change = self.pending[src] = (stat, now)
+            # Stable since the previous scan or modified long enough ago
+            if (now - change[1] < self.debounce and
+                    time.time() - stat[0] / 1e9 < self.debounce):
+                continue
+            del self.pending[src]
+            try:
+                digest = _digest(src)
+            except OSError:
+                continue
+            if last is not None and last[1] == digest:
+                # Touched without being modified
+                self.translated[src] = (stat, digest)
+                continue
+            self.translate(src, dst, stat, digest)
+            count += 1
+        for src in list(self.translated):
+            if src not in found:
+                del self.translated[src]
+                self.pending.pop(src, None)
+        return count
+
+    # Translate the files out of date, then watch the trees until
+    # interrupted
+    def run(self):
+        parser.get_parser()
+        self.poll(initial=True)
+        self.out.write("Watching %s, press Ctrl-C to stop\n"
+                       % ", ".join(self.paths))
+        self.out.flush()
+        try:
+            while True:
+                time.sleep(self.interval)
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+        self.out.write("%d translations (%d failed)\n"
+                       % (self.translations, self.failures))
+        return self.failures